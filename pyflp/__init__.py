@@ -29,10 +29,29 @@ Full docs are available at https://pyflp.rtfd.io.
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import io
+import itertools
+import mmap as _mmap
 import os
 import pathlib
+import shutil
+import sys
+import tempfile
+from typing import IO, Any, BinaryIO
 
-from bytesioex import BytesIOEx
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+if sys.version_info >= (3, 9):
+    from collections.abc import Iterable, Iterator
+else:
+    from typing import Iterable, Iterator
+
+from bytesioex import BytesIOEx, Short, UInt, UShort
 
 from ._events import (
     DATA,
@@ -43,42 +62,69 @@ from ._events import (
     AnyEvent,
     AsciiEvent,
     EventEnum,
+    EventTable,
     U8Event,
     U16Event,
     U32Event,
     UnicodeEvent,
     UnknownDataEvent,
 )
-from .exceptions import HeaderCorrupted, VersionNotDetected
+from .cache import ParseCache
+from .channel import ChannelID
+from .exceptions import ExpectedValue, HeaderCorrupted, VersionNotDetected
 from .plugin import PluginID, get_event_by_internal_name
-from .project import VALID_PPQS, FileFormat, Project, ProjectID
+from .project import (
+    _SUBSYSTEMS,
+    VALID_PPQS,
+    FileFormat,
+    Project,
+    ProjectID,
+    ProjectInfo,
+)
 
-__all__ = ["parse", "save"]
+__all__ = ["dumps", "iter_events", "parse", "parse_many", "probe", "save"]
 __version__ = "2.0.0a1"
 
 
-def parse(file: str | pathlib.Path) -> Project:
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-locals
-    # pylint: disable=too-many-statements
-    # pylint: disable=too-complex
-    """Parse an FL Studio project file.
+def _build_event_types() -> list[type[AnyEvent] | None]:
+    """Maps every possible event ID to the type it gets parsed as.
 
-    Args:
-        file (str | pathlib.Path): Path to the FLP.
+    IDs whose type can only be decided while parsing are mapped to `None`.
+    These are strings (their encoding depends on the FL version) and plugin
+    data (its type depends on the internal name of the plugin).
+    """
+    event_types: list[type[AnyEvent] | None] = []
+    for id in range(256):
+        event_type: type[AnyEvent] | None = None
+        for enum_type in EventEnum.__subclasses__():
+            if id in enum_type:
+                event_type = getattr(enum_type(id), "type")
+                break
 
-    Raises:
-        HeaderCorrupted: When an invalid value is found in the file header.
-        VersionNotDetected: A correct string type couldn't be determined.
+        if event_type is None:
+            if id < WORD:
+                event_type = U8Event
+            elif id < DWORD:
+                event_type = U16Event
+            elif id < TEXT:
+                event_type = U32Event
+            elif id >= DATA and id not in NEW_TEXT_IDS and id != PluginID.Data:
+                event_type = UnknownDataEvent
+        event_types.append(event_type)
+    return event_types
 
-    Returns:
-        Project: The parsed object.
-    """
-    with open(file, "rb") as flp:
-        stream = BytesIOEx(flp.read())
 
-    events: list[AnyEvent] = []
+_EVENT_TYPES: Final = _build_event_types()
+"""Event type lookup table, indexed by event ID."""
 
+
+def _parse_header(stream: BytesIOEx) -> tuple[FileFormat, int, int, int]:
+    """Validates the header and data chunk size prefix from `stream`.
+
+    Returns:
+        tuple[FileFormat, int, int, int]: The file format, number of channels,
+            PPQ and the size of the data chunk (in that order).
+    """
     if stream.read(4) != b"FLhd":  # 4
         raise HeaderCorrupted("Unexpected header chunk magic; expected 'FLhd'")
 
@@ -108,87 +154,509 @@ def parse(file: str | pathlib.Path) -> Project:
     if events_size is None:
         raise HeaderCorrupted("Data chunk size couldn't be read")
 
-    stream.seek(0, os.SEEK_END)
-    file_size = stream.tell()
-    if file_size != events_size + 22:
-        raise HeaderCorrupted("Data chunk size corrupted")
+    return format, channel_count, ppq, events_size
 
-    plug_name = None
-    str_type = None
-    stream.seek(22)  # Back to start of events
-    while True:
-        event_type: type[AnyEvent] | None = None
-        id = stream.read_B()
-        if id is None:
-            break
+
+def _build_selective_event_types(
+    include: Iterable[str],
+) -> list[type[AnyEvent] | None]:
+    """Returns a copy of `_EVENT_TYPES`, for parsing only the subsystems in `include`.
+
+    Data events of all other subsystems are parsed as :class:`UnknownDataEvent`.
+
+    Raises:
+        ExpectedValue: When `include` contains an unknown subsystem.
+    """
+    include = set(include)
+    for name in include:
+        if name not in _SUBSYSTEMS:
+            raise ExpectedValue(name, *_SUBSYSTEMS)
+
+    event_types = list(_EVENT_TYPES)
+    for name, enums in _SUBSYSTEMS.items():
+        if name not in include:
+            for enum_ in enums:
+                for id in enum_:
+                    if id >= DATA and id not in NEW_TEXT_IDS:
+                        event_types[id] = UnknownDataEvent
+    return event_types
+
+
+class _TypeResolver:
+    """Decides event types, some of which depend on the events preceding them."""
+
+    def __init__(self, event_types: list[type[AnyEvent] | None] = _EVENT_TYPES):
+        self._event_types = event_types
+        self._plug_name: str | None = None
+        self._str_type: type[AnyEvent] | None = None
+
+    def __call__(
+        self, id: int, buf: bytes | memoryview, start: int, size: int
+    ) -> type[AnyEvent]:
+        """Returns the type of an event whose data is at `buf[start:start+size]`.
+
+        Raises:
+            VersionNotDetected: A correct string type couldn't be determined.
+        """
+        end = start + size
+        event_type = self._event_types[id]
+        if event_type is not None:
+            if id == ProjectID.FLVersion:
+                version = bytes(buf[start:end]).decode("ascii")
+                if int(version.split(".")[0]) >= 12:
+                    self._str_type = UnicodeEvent
+                else:
+                    self._str_type = AsciiEvent
+            return event_type
+
+        if id == PluginID.Data:
+            if self._plug_name is not None:
+                event_type = get_event_by_internal_name(self._plug_name)
+            return event_type or UnknownDataEvent
+
+        if self._str_type is None:
+            raise VersionNotDetected
+
+        if id == PluginID.InternalName:
+            data = bytes(buf[start:end])
+            self._plug_name = self._str_type(id, data).value
+        return self._str_type
+
+
+def _scan_events(
+    buf: bytes | memoryview, event_types: list[type[AnyEvent] | None] = _EVENT_TYPES
+) -> EventTable:
+    """Finds the offsets, sizes and types of all the events in `buf`.
+
+    Raises:
+        VersionNotDetected: A correct string type couldn't be determined.
+    """
+    pos = 22  # Start of events
+    table = EventTable(buf, pos)
+    resolve = _TypeResolver(event_types)
+    buf_size = len(buf)
+    while pos < buf_size:
+        id = buf[pos]
+        pos += 1
 
         if id < WORD:
-            value = stream.read(1)
+            size = 1
         elif id < DWORD:
-            value = stream.read(2)
+            size = 2
         elif id < TEXT:
-            value = stream.read(4)
+            size = 4
+        else:  # Decode the varint which stores the size of the event data
+            size = shift = 0
+            while pos < buf_size:
+                byte = buf[pos]
+                pos += 1
+                size |= (byte & 0x7F) << shift
+                shift += 7
+                if not byte & 0x80:
+                    break
+
+        table.append(id, pos, size, resolve(id, buf, pos, size))
+        pos += size
+    return table
+
+
+def _read_event_header(stream: BinaryIO) -> tuple[int, int] | None:
+    """Reads the ID and data size of the next event in `stream`.
+
+    Returns:
+        tuple[int, int] | None: The event ID and data size or `None` when
+            `stream` ends. The stream is left positioned at the event data.
+    """
+    id_buf = stream.read(1)
+    if not id_buf:
+        return None
+
+    id = id_buf[0]
+    if id < WORD:
+        return id, 1
+    if id < DWORD:
+        return id, 2
+    if id < TEXT:
+        return id, 4
+
+    size = shift = 0
+    for byte in iter(lambda: stream.read(1), b""):
+        size |= (byte[0] & 0x7F) << shift
+        shift += 7
+        if not byte[0] & 0x80:
+            break
+    return id, size
+
+
+def _read_event(stream: BinaryIO) -> tuple[int, bytes] | None:
+    """Reads the next event from `stream`; returns `None` when it ends."""
+    header = _read_event_header(stream)
+    if header is None:
+        return None
+
+    id, size = header
+    data = stream.read(size)
+    if len(data) != size:
+        raise HeaderCorrupted("Data chunk size corrupted")
+    return id, data
+
+
+def _iter_stream(stream: BinaryIO, raw: bool) -> Iterator[AnyEvent | tuple[int, bytes]]:
+    *_, events_size = _parse_header(BytesIOEx(stream.read(22)))
+    if stream.seekable():
+        start = stream.tell()
+        if stream.seek(0, os.SEEK_END) - start != events_size:
+            raise HeaderCorrupted("Data chunk size corrupted")
+        stream.seek(start)
+
+    resolve = _TypeResolver()
+    while True:
+        event = _read_event(stream)
+        if event is None:
+            break
+
+        id, data = event
+        if raw:
+            yield id, data
         else:
-            value = stream.read(stream.read_v())
+            yield resolve(id, data, 0, len(data))(id, data)
 
-        if id == ProjectID.FLVersion:
-            if int(value.decode("ascii").split(".")[0]) >= 12:
-                str_type = UnicodeEvent
-            else:
-                str_type = AsciiEvent
 
-        for enum_type in EventEnum.__subclasses__():
-            if id in enum_type:
-                event_type = getattr(enum_type(id), "type")
-                break
+def iter_events(
+    file: str | pathlib.Path | BinaryIO, raw: bool = False
+) -> Iterator[AnyEvent | tuple[int, bytes]]:
+    """Iterates over the events of an FL Studio project file one at a time.
 
-        if event_type is None:
-            if id < WORD:
-                event_type = U8Event
-            elif id < DWORD:
-                event_type = U16Event
-            elif id < TEXT:
-                event_type = U32Event
-            elif id < DATA or id in NEW_TEXT_IDS:
-                if str_type is None:
-                    raise VersionNotDetected
-                event_type = str_type
-
-                if id == PluginID.InternalName:
-                    plug_name = event_type(id, value).value
-            elif id == PluginID.Data and plug_name is not None:
-                event_type = get_event_by_internal_name(plug_name) or UnknownDataEvent
+    Neither a :class:`Project` is created nor are the events kept in memory.
+    Use this when only event-level information is needed from a file.
+
+        >>> for event in pyflp.iter_events("/path/to/parse.flp"):
+        ...     if event.id == PluginID.InternalName:
+        ...         print(event.value)
+
+    Args:
+        file (str | pathlib.Path | BinaryIO): Path to the FLP or a binary
+            file object positioned at its beginning.
+        raw (bool, False): Yield `(id, data)` tuples instead of events.
+
+    Raises:
+        HeaderCorrupted: When an invalid value is found in the file header.
+        VersionNotDetected: A correct string type couldn't be determined.
+    """
+    if isinstance(file, (str, pathlib.Path)):
+        with open(file, "rb") as flp:
+            yield from _iter_stream(flp, raw)
+    else:
+        yield from _iter_stream(file, raw)
+
+
+def parse(
+    file: str | pathlib.Path,
+    mmap: bool = False,
+    lazy: bool = False,
+    include: Iterable[str] | None = None,
+    cache: ParseCache | None = None,
+) -> Project:
+    """Parse an FL Studio project file.
+
+    Args:
+        file (str | pathlib.Path): Path to the FLP.
+        mmap (bool, False): Memory-map the file instead of reading it. Data
+            events (plugin states, structures, etc.) reference their payload
+            directly from the mapping instead of keeping a copy of it, until
+            they get changed.
+        lazy (bool, False): Only scan the events, an event gets created when
+            it is first needed by the project or one of its models.
+        include (Iterable[str], optional): Names of the subsystems whose data
+            events get decoded; any of "arrangements", "channels", "mixer",
+            "patterns" and "plugins". Data events of other subsystems are
+            kept as opaque bytes, so models of those shouldn't be used. The
+            file still gets saved back exactly as it was. Decodes all
+            subsystems by default.
+        cache (ParseCache, optional): Loads the scanned events of an unchanged
+            file from this cache, scanning and storing them otherwise.
+
+    Raises:
+        HeaderCorrupted: When an invalid value is found in the file header.
+        VersionNotDetected: A correct string type couldn't be determined.
+        ExpectedValue: When `include` contains an unknown subsystem.
+
+    Returns:
+        Project: The parsed object.
+    """
+    with open(file, "rb") as flp:
+        if mmap:
+            buf: bytes | memoryview = memoryview(
+                _mmap.mmap(flp.fileno(), 0, access=_mmap.ACCESS_READ)
+            )
+        else:
+            buf = flp.read()
+        stat = os.fstat(flp.fileno())
+
+    if include is not None:
+        include = sorted(set(include))
+    tag = f"{__version__}:{'*' if include is None else ','.join(include)}"
+
+    scan = None if cache is None else cache.load(file, stat, buf, tag)
+    if scan is not None:
+        format = FileFormat(scan.format)
+        channel_count, ppq, table = scan.channel_count, scan.ppq, scan.table
+    else:
+        format, channel_count, ppq, events_size = _parse_header(BytesIOEx(buf[:22]))
+        if len(buf) != events_size + 22:
+            raise HeaderCorrupted("Data chunk size corrupted")
+
+        if include is None:
+            table = _scan_events(buf)
+        else:
+            table = _scan_events(buf, _build_selective_event_types(include))
+
+        if cache is not None:
+            cache.store(file, stat, format, channel_count, ppq, table, tag)
+
+    if not lazy:
+        table.materialize()
+    return Project(table, channel_count=channel_count, format=format, ppq=ppq)
+
+
+def parse_many(
+    paths: Iterable[str | pathlib.Path],
+    workers: int | None = None,
+    include: Iterable[str] | None = None,
+) -> Iterator[tuple[str | pathlib.Path, Project | Exception]]:
+    """Parse FL Studio project files in parallel, across a pool of processes.
+
+    The results are yielded in the order the files finish parsing in. Each
+    project is sent back from its worker as its raw event data and an offset
+    table, so its events get created lazily, like with `parse(lazy=True)`.
+
+    Args:
+        paths (Iterable[str | pathlib.Path]): Paths to the FLPs.
+        workers (int, optional): Number of worker processes. Defaults to the
+            number of processors on the machine.
+        include (Iterable[str], optional): See :func:`parse`.
+
+    Yields:
+        tuple[str | pathlib.Path, Project | Exception]: The path of a file,
+            along with the parsed object or the exception raised while
+            parsing it. Other files are parsed regardless of such failures.
+    """
+    if include is not None:
+        include = tuple(include)
+    worker = functools.partial(parse, lazy=True, include=include)
+    paths = iter(paths)
+
+    # Limits the number of results kept in memory for a slower consumer
+    backlog = 4 * (workers or os.cpu_count() or 1)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        pending = {
+            executor.submit(worker, path): path
+            for path in itertools.islice(paths, backlog)
+        }
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    yield path, future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    yield path, exc
+
+            for path in itertools.islice(paths, len(done)):
+                pending[executor.submit(worker, path)] = path
+
+
+_PROBED_IDS: Final = frozenset(
+    (
+        ProjectID.FLVersion,
+        ProjectID.FLBuild,
+        ProjectID.Title,
+        ProjectID.Artists,
+        ProjectID.Genre,
+        ProjectID.Tempo,
+        ProjectID.Timestamp,
+    )
+)
+# Only saved by old versions of FL, which never save `ProjectID.Tempo`
+_LEGACY_PROBED_IDS: Final = frozenset((ProjectID._TempoCoarse, ProjectID._TempoFine))
+
+
+def probe(file: str | pathlib.Path | BinaryIO) -> ProjectInfo:
+    """Quickly reads the header and some metadata of an FL Studio project file.
+
+    Only the events storing the metadata are decoded. Reading stops as soon
+    as all of those saved by modern versions of FL Studio are found or the
+    channel rack begins, whichever is first.
+    Use this instead of :func:`parse` when only this metadata is needed.
+
+    Args:
+        file (str | pathlib.Path | BinaryIO): Path to the FLP or a binary
+            file object positioned at its beginning.
+
+    Raises:
+        HeaderCorrupted: When an invalid value is found in the file header.
+        VersionNotDetected: A correct string type couldn't be determined.
+    """
+    if isinstance(file, (str, pathlib.Path)):
+        with open(file, "rb") as flp:
+            return _probe_stream(flp)
+    return _probe_stream(file)
+
+
+def _probe_stream(stream: BinaryIO) -> ProjectInfo:
+    format, channel_count, ppq, _ = _parse_header(BytesIOEx(stream.read(22)))
+    values: dict[int, Any] = {}
+    resolve = _TypeResolver()
+    while not _PROBED_IDS.issubset(values):
+        header = _read_event_header(stream)
+        if header is None or header[0] == ChannelID.New:
+            break
+
+        id, size = header
+        if id not in _PROBED_IDS and id not in _LEGACY_PROBED_IDS:
+            if stream.seekable():
+                stream.seek(size, os.SEEK_CUR)
             else:
-                event_type = UnknownDataEvent
+                stream.read(size)
+            continue
+
+        data = stream.read(size)
+        event = resolve(id, data, 0, size)(id, data)
+        values[id] = event if id == ProjectID.Timestamp else event.value
+
+    return ProjectInfo.from_values(values, format, channel_count, ppq)
+
+
+_BATCH_SIZE: Final = 1 << 16
 
-        events.append(event_type(id, value))
 
-    return Project(*events, channel_count=channel_count, format=format, ppq=ppq)
+def _dump(project: Project, stream: BinaryIO):
+    """Writes `project` to `stream` in batches, without building it whole.
 
+    For a project parsed from a file, only the events changed since then
+    are serialised again, the rest are copied over as they were.
+    """
+    events = project._events_tuple  # pylint: disable=protected-access
+    if isinstance(events, EventTable):
+        segments = events.segments()
+        events_size = events.sizeof()
+    else:
+        segments = list(events)
+        events_size = sum(len(segment) for segment in segments)
+
+    batch = bytearray()
+    batch += b"FLhd"
+    batch += UInt.pack(6)
+    batch += Short.pack(project.format)
+    batch += UShort.pack(project.channel_count)
+    batch += UShort.pack(project.ppq)
+    batch += b"FLdt"
+    batch += UInt.pack(events_size)
+
+    written = 0
+    for segment in segments:
+        data = segment if isinstance(segment, memoryview) else bytes(segment)
+        written += len(data)
+        if len(data) >= _BATCH_SIZE:
+            stream.write(batch)
+            stream.write(data)
+            batch.clear()
+        else:
+            batch += data
+            if len(batch) >= _BATCH_SIZE:
+                stream.write(batch)
+                batch.clear()
+    stream.write(batch)
+
+    if written != events_size:  # pragma: no cover
+        raise RuntimeError(
+            f"Events are {written} bytes, but were sized as {events_size} bytes"
+        )
+
+
+def dumps(project: Project) -> bytes:
+    """Serialise a parsed project into the contents of an FLP.
+
+    Args:
+        project (Project): The object returned by `parse`.
+    """
+    stream = io.BytesIO()
+    _dump(project, stream)
+    return stream.getvalue()
 
-def save(project: Project, file: str):
+
+def _replacement(target: str) -> IO[bytes] | None:
+    """Creates a temporary file to replace `target` with, if that's safe.
+
+    The temporary file gets the mode and owner of `target`. Returns None if
+    `target` isn't writable or has other hard links, or if the temporary file
+    can't be created next to it or given its owner.
+    """
+    st = os.stat(target)
+    if st.st_nlink > 1 or not os.access(target, os.W_OK):
+        return None
+
+    try:
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=os.path.dirname(target), delete=False
+        )
+    except OSError:  # The directory isn't writable
+        return None
+
+    try:
+        tmp_st = os.fstat(tmp.fileno())
+        if (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+            os.chown(tmp.name, st.st_uid, st.st_gid)
+        shutil.copymode(target, tmp.name)
+    except OSError:
+        tmp.close()
+        os.remove(tmp.name)
+        return None
+    return tmp
+
+
+def save(project: Project, file: str | pathlib.Path | BinaryIO):
     """Save a parsed project back into a file.
 
+    Events are written to `file` as they are serialised, in batches. When
+    `file` is the path of an existing file, the contents are first written
+    to a temporary file which then replaces it (or the file it links to),
+    keeping its mode and owner. On POSIX systems, this keeps a project parsed
+    with `mmap=True` intact, even when it is saved back to the same file it
+    was parsed from. A file which isn't writable, has other hard links or
+    whose owner can't be kept is overwritten instead, once the project has
+    been serialised in memory.
+
     Args:
         project (Project): The object returned by `parse`.
-        file (str): The file in which the contents of `project` are serialised back.
+        file (str | pathlib.Path | BinaryIO): The path or a writable binary
+            file object in which the contents of `project` are serialised.
     """
-    stream = BytesIOEx()
-    stream.write(b"FLhd")  # 4
-    stream.write_I(6)  # 8
-    stream.write_h(project.format)  # 10
-    stream.write_H(project.channel_count)  # 12
-    stream.write_H(project.ppq)  # 14
-    stream.write(b"FLdt")  # 18
-    stream.seek(4, 1)  # leave space for total event size
-
-    events_size = 0
-    for event in project.events_astuple():
-        events_size += len(event)
-        stream.write(bytes(event))
-
-    stream.seek(18)
-    stream.write_I(events_size)
-
-    with open(file, "wb") as flp:
-        flp.write(stream.getvalue())
+    if not isinstance(file, (str, os.PathLike)):
+        _dump(project, file)
+        return
+
+    target = os.path.realpath(file)
+    if not os.path.exists(target):
+        with open(target, "wb") as flp:
+            _dump(project, flp)
+        return
+
+    tmp = _replacement(target)
+    if tmp is None:
+        data = dumps(project)  # `project` might be mapped from `target`
+        with open(target, "wb") as flp:
+            flp.write(data)
+        return
+
+    with tmp:
+        try:
+            _dump(project, tmp)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    os.replace(tmp.name, target)
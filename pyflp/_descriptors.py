@@ -39,6 +39,29 @@ else:
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 
+# What a descriptor gets its value from, cached by the type of the instance.
+_OTHER, _ITEM, _SINGLE, _MULTI, _POD, _STRUCT = range(6)
+_kinds: dict[type, int] = {}
+
+
+def _kind(cls: type) -> int:
+    kind = _kinds.get(cls)
+    if kind is None:
+        if issubclass(cls, ItemModel):
+            kind = _ITEM
+        elif issubclass(cls, SingleEventModel):
+            kind = _SINGLE
+        elif issubclass(cls, MultiEventModel):
+            kind = _MULTI
+        elif issubclass(cls, PODEventBase):
+            kind = _POD
+        elif issubclass(cls, StructEventBase):
+            kind = _STRUCT
+        else:
+            kind = _OTHER
+        _kinds[cls] = kind
+    return kind
+
 
 @runtime_checkable
 class ROProperty(Protocol[T_co]):
@@ -71,18 +94,17 @@ class PropBase(abc.ABC, RWProperty[T]):
         self._default = default
 
     def _get_event(self, instance: ModelBase) -> Any:
-        if isinstance(instance, ItemModel):
-            return instance  # type: ignore
-
-        if isinstance(instance, SingleEventModel):
-            return instance.event()
-
-        if isinstance(instance, MultiEventModel) and self._ids:
+        kind = _kind(type(instance))
+        if kind == _MULTI:
+            events_dict = instance._events  # type: ignore
             for id in self._ids:
-                try:
-                    return instance.events_asdict()[id][0]
-                except (KeyError, IndexError):
-                    pass
+                events = events_dict.get(id)
+                if events:
+                    return events[0]
+        elif kind == _ITEM:
+            return instance  # type: ignore
+        elif kind == _SINGLE:
+            return instance.event()  # type: ignore
 
     @property
     def default(self) -> T | None:  # Configure version based defaults here
@@ -114,7 +136,8 @@ class PropBase(abc.ABC, RWProperty[T]):
             self._set(event, value)
         elif self._ids:
             raise PropertyCannotBeSet(*self._ids)
-        raise PropertyCannotBeSet
+        else:
+            raise PropertyCannotBeSet
 
 
 class FlagProp(PropBase[bool]):
@@ -137,21 +160,22 @@ class FlagProp(PropBase[bool]):
                 invert the value to be set / returned.
         """
         self._flag = flag
-        self._flag_type = type(flag)
+        self._mask = int(flag)
         self._prop = prop
         self._inverted = inverted
         super().__init__(*ids, default=default)
 
     def _get(self, ev_or_ins: Any) -> bool | None:
-        if isinstance(ev_or_ins, PODEventBase):
+        kind = _kind(type(ev_or_ins))
+        if kind == _POD:
             flags = ev_or_ins.value  # type: ignore
-        elif isinstance(ev_or_ins, (ItemModel, StructEventBase)):
+        elif kind in (_ITEM, _STRUCT):
             flags = ev_or_ins[self._prop]
         else:
             return Never
 
         if flags is not None:
-            retbool = self._flag in self._flag_type(flags)
+            retbool = int(flags) & self._mask == self._mask
             return not retbool if self._inverted else retbool
 
     def _set(self, ev_or_ins: Any, value: bool):
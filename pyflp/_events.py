@@ -20,11 +20,15 @@ and unmarshalling.
 from __future__ import annotations
 
 import abc
+import array
+import collections
 import enum
+import operator
+import struct
 import sys
 import warnings
 from collections.abc import Hashable, Sized
-from typing import Any, ClassVar, Dict, Generic, Tuple, TypeVar, Union, cast
+from typing import Any, Callable, ClassVar, Dict, Generic, Tuple, TypeVar, Union, cast
 
 if sys.version_info >= (3, 8):
     from typing import Final, SupportsIndex
@@ -32,9 +36,9 @@ else:
     from typing_extensions import Final, SupportsIndex
 
 if sys.version_info >= (3, 9):
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 else:
-    from typing import Iterable
+    from typing import Iterable, Sequence
 
 import colour
 from bytesioex import (
@@ -50,6 +54,11 @@ from bytesioex import (
     UShort,
 )
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
 from .exceptions import EventIDOutOfRange, InvalidEventChunkSize, PropertyCannotBeSet
 
 BYTE: Final = 0
@@ -71,9 +80,12 @@ T_co = TypeVar("T_co", covariant=True)
 class EventBase(Generic[T], Sized, Hashable):
     """Abstract base class representing an event."""
 
+    __slots__ = ("id", "_raw", "_dirty")
+
     def __init__(self, id: int, data: bytes):
         self.id: Final = id
         self._raw = data
+        self._dirty = False  # Whether the event was changed after creation
 
     def __eq__(self, o: object):
         if not isinstance(o, EventBase):
@@ -88,6 +100,10 @@ class EventBase(Generic[T], Sized, Hashable):
     def __hash__(self):
         return hash(bytes(self))
 
+    def __reduce__(self):
+        bytes(self)  # syncs `_raw` with any changes made after creation
+        return type(self), (self.id, bytes(self._raw))
+
     @abc.abstractmethod
     def __bytes__(self) -> bytes:
         ...
@@ -96,6 +112,10 @@ class EventBase(Generic[T], Sized, Hashable):
     def __len__(self) -> int:
         """Serialised event size (in bytes)."""
 
+    def _changed(self):
+        """Marks the event as changed, called after its data is changed."""
+        self._dirty = True
+
     @property
     def value(self) -> T:
         """Deserialized event-type specific value."""
@@ -112,6 +132,8 @@ AnyEvent = EventBase[Any]
 class PODEventBase(EventBase[T], abc.ABC):
     """Base class for events whose size is predetermined (POD types)."""
 
+    __slots__ = ()
+
     TYPE_SIZE: ClassVar[int]
     ID_RANGE: ClassVar[tuple[int, int]]
 
@@ -140,6 +162,8 @@ class PODEventBase(EventBase[T], abc.ABC):
 class ByteEventBase(PODEventBase[T], abc.ABC):
     """Base class of events used for storing 1 byte data."""
 
+    __slots__ = ()
+
     TYPE_SIZE = 1
     ID_RANGE = (BYTE, WORD)
 
@@ -159,6 +183,8 @@ class ByteEventBase(PODEventBase[T], abc.ABC):
 class BoolEvent(ByteEventBase[bool]):
     """An event used for storing a boolean."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> bool:
         return Bool.unpack(self._raw)[0]
@@ -167,11 +193,14 @@ class BoolEvent(ByteEventBase[bool]):
     def value(self, value: bool):
         if value is not None:
             self._raw = Bool.pack(value)
+            self._changed()
 
 
 class I8Event(ByteEventBase[int]):
     """An event used for storing a 1 byte signed integer."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return SByte.unpack(self._raw)[0]
@@ -180,11 +209,14 @@ class I8Event(ByteEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = SByte.pack(value)
+            self._changed()
 
 
 class U8Event(ByteEventBase[int]):
     """An event used for storing a 1 byte unsigned integer."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return Byte.unpack(self._raw)[0]
@@ -193,11 +225,14 @@ class U8Event(ByteEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = Byte.pack(value)
+            self._changed()
 
 
 class WordEventBase(PODEventBase[T], abc.ABC):
     """Base class of events used for storing 2 byte data."""
 
+    __slots__ = ()
+
     TYPE_SIZE = 2
     ID_RANGE = (WORD, DWORD)
 
@@ -217,6 +252,8 @@ class WordEventBase(PODEventBase[T], abc.ABC):
 class I16Event(WordEventBase[int]):
     """An event used for storing a 2 byte signed integer."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return Short.unpack(self._raw)[0]
@@ -225,11 +262,14 @@ class I16Event(WordEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = Short.pack(value)
+            self._changed()
 
 
 class U16Event(WordEventBase[int]):
     """An event used for storing a 2 byte unsigned integer."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return UShort.unpack(self._raw)[0]
@@ -238,11 +278,14 @@ class U16Event(WordEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = UShort.pack(value)
+            self._changed()
 
 
 class DWordEventBase(PODEventBase[T], abc.ABC):
     """Base class of events used for storing 4 byte data."""
 
+    __slots__ = ()
+
     TYPE_SIZE = 4
     ID_RANGE = (DWORD, TEXT)
 
@@ -262,6 +305,8 @@ class DWordEventBase(PODEventBase[T], abc.ABC):
 class F32Event(DWordEventBase[float]):
     """An event used for storing 4 byte floats."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> float:
         return Float.unpack(self._raw)[0]
@@ -270,11 +315,14 @@ class F32Event(DWordEventBase[float]):
     def value(self, value: float):
         if value is not None:
             self._raw = Float.pack(value)
+            self._changed()
 
 
 class I32Event(DWordEventBase[int]):
     """An event used for storing a 4 byte signed integer."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         return Int.unpack(self._raw)[0]
@@ -283,11 +331,14 @@ class I32Event(DWordEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = Int.pack(value)
+            self._changed()
 
 
 class U32Event(DWordEventBase[int]):
     """An event used for storing a 4 byte unsigned integer."""
 
+    __slots__ = ()
+
     @property
     def value(self):
         return UInt.unpack(self._raw)[0]
@@ -296,11 +347,14 @@ class U32Event(DWordEventBase[int]):
     def value(self, value: int):
         if value is not None:
             self._raw = UInt.pack(value)
+            self._changed()
 
 
 class U16TupleEvent(DWordEventBase[Tuple[int, int]]):
     """An event used for storing a two-tuple of 2 byte unsigned integers."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> tuple[int, int]:
         return UInt.unpack(self._raw)
@@ -308,11 +362,14 @@ class U16TupleEvent(DWordEventBase[Tuple[int, int]]):
     @value.setter
     def value(self, value: tuple[int, int]):
         self._raw = UInt.pack(*value)
+        self._changed()
 
 
 class ColorEvent(DWordEventBase[colour.Color]):
     """A 4 byte event which stores a color."""
 
+    __slots__ = ()
+
     @staticmethod
     def decode(buf: bytes):
         r, g, b = (c / 255 for c in buf[:3])
@@ -329,28 +386,55 @@ class ColorEvent(DWordEventBase[colour.Color]):
     @value.setter
     def value(self, value: colour.Color):
         self._raw = self.encode(value)
+        self._changed()
 
 
 class VarintEventBase(EventBase[T], abc.ABC):
+    __slots__ = ("_size", "_on_resize")
+
+    def __init__(self, id: int, data: bytes):
+        super().__init__(id, data)
+        self._size: int | None = None  # Cached result of `__len__`
+
+        # Called with the change in size of the event (in bytes), if set.
+        self._on_resize: Callable[[int], None] | None = None
+
     @staticmethod
     def _to_varint(buffer: bytes):
         ret = bytearray()
         buflen = len(buffer)
-        while buflen <= 0:
+        while True:
             towrite = buflen & 0x7F
             buflen >>= 7
             if buflen > 0:
                 towrite |= 0x80
             ret.append(towrite)
-            # if buflen <= 0:
-            #     break
+            if buflen <= 0:
+                break
         return ret
 
+    @staticmethod
+    def _varint_size(size: int) -> int:
+        """Number of bytes :meth:`_to_varint` uses for a buffer of `size`."""
+        return max(1, (size.bit_length() + 6) // 7)
+
     def __len__(self):
+        if self._size is None:
+            self._size = self._sizeof()
+        return self._size
+
+    def _sizeof(self) -> int:
+        """Computes the serialised event size, which `__len__` caches."""
         if self._raw is not None:
-            return 1 + len(self._to_varint(self._raw)) + len(self._raw)
+            return 1 + self._varint_size(len(self._raw)) + len(self._raw)
         return 2
 
+    def _changed(self):
+        super()._changed()
+        old_size, self._size = self._size, None
+        if self._on_resize is not None and old_size is not None:
+            self._on_resize(len(self) - old_size)
+
     def __bytes__(self):
         id = Byte.pack(self.id)
 
@@ -360,13 +444,18 @@ class VarintEventBase(EventBase[T], abc.ABC):
 
 
 class U64DataEvent(VarintEventBase[Union[bytes, str]]):
+    __slots__ = ("_isascii",)
+
     def __init__(self, id: int, data: bytes, isascii: bool = False):
         super().__init__(id, data)
         self._isascii = isascii
 
-    def __len__(self):
+    def _sizeof(self):
         return 9 + len(self._raw)
 
+    def __reduce__(self):
+        return type(self), (self.id, bytes(self._raw), self._isascii)
+
     def __bytes__(self):
         id = UInt.pack(self.id)
         length = ULong.pack(len(self._raw))  # 8 bytes for denoting size, wth IL?
@@ -382,11 +471,14 @@ class U64DataEvent(VarintEventBase[Union[bytes, str]]):
             self._raw = value.encode("ascii")
         else:
             self._raw = value
+        self._changed()
 
 
 class StrEventBase(VarintEventBase[str], abc.ABC):
     """Base class of events used for storing strings."""
 
+    __slots__ = ()
+
     def __init__(self, id: int, data: bytes):
         """
         Args:
@@ -406,6 +498,8 @@ class StrEventBase(VarintEventBase[str], abc.ABC):
 
 
 class AsciiEvent(StrEventBase):
+    __slots__ = ()
+
     @property
     def value(self):
         return self._raw.decode("ascii").rstrip("\0")
@@ -414,9 +508,12 @@ class AsciiEvent(StrEventBase):
     def value(self, value: str):
         if value is not None:
             self._raw = value.encode("ascii") + b"\0"
+            self._changed()
 
 
 class UnicodeEvent(StrEventBase):
+    __slots__ = ()
+
     @property
     def value(self):
         return self._raw.decode("utf-16-le").rstrip("\0")
@@ -425,9 +522,12 @@ class UnicodeEvent(StrEventBase):
     def value(self, value: str):
         if value is not None:
             self._raw = value.encode("utf-16-le") + b"\0\0"
+            self._changed()
 
 
 class DataEventBase(VarintEventBase[bytes]):
+    __slots__ = ("_stream_len", "_lazy_stream")
+
     def __init__(self, id: int, data: bytes):
         """
         Args:
@@ -441,13 +541,33 @@ class DataEventBase(VarintEventBase[bytes]):
             raise EventIDOutOfRange(id, DATA, 255)
 
         self._stream_len = len(data)
-        self._stream = BytesIOEx(data)
+        self._lazy_stream: BytesIOEx | None = None
         super().__init__(id, data)
 
     def __bytes__(self):
-        self._raw = self._stream.getvalue()
+        if self._lazy_stream is not None:
+            self._raw = self._lazy_stream.getvalue()
         return super().__bytes__()
 
+    def _sizeof(self):
+        if self._lazy_stream is None:
+            return super()._sizeof()
+
+        with self._lazy_stream.getbuffer() as view:
+            size = view.nbytes
+        return 1 + self._varint_size(size) + size
+
+    @property
+    def _stream(self) -> BytesIOEx:
+        """A stream over the event data, created on its first access.
+
+        Events which don't need it keep referring to the data they were
+        created with, which might be a view into a memory-mapped file.
+        """
+        if self._lazy_stream is None:
+            self._lazy_stream = BytesIOEx(self._raw)
+        return self._lazy_stream
+
     def __repr__(self):
         return f"<{type(self).__name__} id={self.id!r}, size={self._stream_len}>"
 
@@ -468,23 +588,36 @@ class _StructMeta(type):
     }
 
     def __new__(cls, name: str, bases: Any, attrs: dict[str, Any]):
-        """Populates :attr:`Struct.OFFSETS` and :attr:`Struct.SIZE`."""
+        """Populates :attr:`Struct.OFFSETS`, :attr:`Struct.SIZE` and codecs.
+
+        The whole structure gets a single precompiled `struct.Struct` which
+        decodes all of its properties in one call, and every property gets
+        one for encoding it back.
+        """
         if "PROPS" not in attrs:
             raise AttributeError(f"Class {name} doesn't have a PROPS attribute")
 
         offset = 0
         offsets = attrs["OFFSETS"] = {}
+        codecs = attrs["_CODECS"] = {}
         for key, type_or_size in cast(Dict[str, Any], attrs["PROPS"]).items():
             offsets[key] = offset
             if isinstance(type_or_size, int):
                 offset += type_or_size
+                codecs[key] = struct.Struct(f"<{type_or_size}s")
             else:
                 offset += cls.SIZES[type_or_size]
+                code = "?" if type_or_size == "bool" else type_or_size
+                codecs[key] = struct.Struct(f"<{code}")
         attrs["SIZE"] = offset
+        attrs["_CODEC"] = struct.Struct(
+            "<" + "".join(codec.format[1:] for codec in codecs.values())
+        )
         return type.__new__(cls, name, bases, attrs)
 
 
 class StructBase(metaclass=_StructMeta):
+    __slots__ = ("_stream", "_owner", "_offset", "_props", "_stream_len")
     OFFSETS: ClassVar[dict[str, int]] = {}
     """A mapping of property names to their offsets in the underlying stream."""
 
@@ -501,6 +634,12 @@ class StructBase(metaclass=_StructMeta):
     The actual stream size maybe different and totally depends on FL version.
     """
 
+    _CODEC: ClassVar[struct.Struct]
+    """Decodes all the properties at once, when enough data is available."""
+
+    _CODECS: ClassVar[dict[str, struct.Struct]]
+    """Encodes the property of the same name."""
+
     TRUNCATE: ClassVar = True
     """Whether or not to truncate the stream size to its size at initialisation.
 
@@ -509,12 +648,29 @@ class StructBase(metaclass=_StructMeta):
     type of variable data.
     """
 
-    def __init__(self, stream: BytesIOEx):
-        self._props: dict[str, Any] = dict.fromkeys(type(self).PROPS)
+    def __init__(self, stream: BytesIOEx, owner: AnyEvent | None = None):
+        """
+        Args:
+            stream (BytesIOEx): The stream to read the structure from; it
+                is written to when a property is set.
+            owner (AnyEvent, optional): The event the stream belongs to. It
+                is marked as changed when a property is set.
+        """
+        cls = type(self)
         self._stream = stream
-        self._stream_len = len(stream.getvalue())
-
-        for key, type_or_size in type(self).PROPS.items():
+        self._owner = owner
+        self._offset = stream.tell()
+        with stream.getbuffer() as view:
+            self._stream_len = view.nbytes
+
+        if self._stream_len - self._offset >= cls.SIZE:
+            values = cls._CODEC.unpack(stream.read(cls.SIZE))
+            self._props: dict[str, Any] = dict(zip(cls.PROPS, values))
+            return
+
+        # Older FL versions have smaller structures; missing props are None
+        self._props = dict.fromkeys(cls.PROPS)
+        for key, type_or_size in cls.PROPS.items():
             if isinstance(type_or_size, int):
                 self._props[key] = self._stream.read(type_or_size)
             else:
@@ -526,6 +682,32 @@ class StructBase(metaclass=_StructMeta):
     def __len__(self):
         return self._stream_len
 
+    @classmethod
+    def dtype(cls) -> numpy.dtype:
+        """A NumPy structured dtype with the same layout; requires NumPy.
+
+        Fields of a size, rather than a type are of a void type.
+        """
+        if numpy is None:
+            raise ModuleNotFoundError("NumPy is required for a dtype")
+
+        dtype = cls.__dict__.get("_DTYPE")
+        if dtype is None:
+            formats = [
+                f"V{t}" if isinstance(t, int) else "?" if t == "bool" else f"<{t}"
+                for t in cls.PROPS.values()
+            ]
+            dtype = numpy.dtype(
+                {
+                    "names": list(cls.PROPS),
+                    "formats": formats,
+                    "offsets": list(cls.OFFSETS.values()),
+                    "itemsize": cls.SIZE,
+                }
+            )
+            setattr(cls, "_DTYPE", dtype)
+        return dtype
+
     def __contains__(self, key: str):
         return key in self._props
 
@@ -536,14 +718,12 @@ class StructBase(metaclass=_StructMeta):
         if key not in type(self).PROPS:
             raise KeyError(key)
 
-        self._stream.seek(type(self).OFFSETS[key])
-        type_or_size = type(self).PROPS[key]
-        if isinstance(type_or_size, int):
-            self._stream.write(value)
-        else:
-            getattr(self._stream, f"write_{type_or_size}")(value)
+        self._stream.seek(self._offset + type(self).OFFSETS[key])
+        self._stream.write(type(self)._CODECS[key].pack(value))
+        if self._owner is not None:
+            self._owner._changed()
 
-        if len(self._stream.getvalue()) > self._stream_len and self.TRUNCATE:
+        if self._stream.tell() > self._stream_len and self.TRUNCATE:
             raise PropertyCannotBeSet
         self._props[key] = value
 
@@ -555,11 +735,13 @@ class StructEventBase(DataEventBase):
     Its size is determined by the event as well as FL version.
     """
 
+    __slots__ = ("_struct",)
+
     STRUCT: ClassVar[type[StructBase]]
 
     def __init__(self, id: int, data: bytes):
         super().__init__(id, data)
-        self._struct = self.STRUCT(self._stream)
+        self._struct = self.STRUCT(self._stream, self)
         if self._stream.tell() < self._stream_len:
             warnings.warn(
                 f"Event {id} not parsed entirely; "
@@ -588,47 +770,171 @@ class StructEventBase(DataEventBase):
         return f"{cls} (id={self.id!r}, size={size}, props={props!r})"
 
 
+class StructView:
+    """An item of a :class:`ListEventBase` viewed from a NumPy structured array.
+
+    Has the same interface as the :class:`StructBase` it stands for, but a
+    property is decoded only when it is accessed and written straight back
+    into the array.
+    """
+
+    __slots__ = ("_struct", "_record", "_owner")
+
+    def __init__(self, struct: type[StructBase], record: Any, owner: AnyEvent):
+        """
+        Args:
+            struct (type[StructBase]): The structure this is a view of.
+            record (numpy.void): An item of an array of `struct.dtype()`.
+            owner (AnyEvent): The event the array belongs to. It is marked
+                as changed when a property is set.
+        """
+        self._struct = struct
+        self._record = record
+        self._owner = owner
+
+    def __bytes__(self):
+        return self._record.tobytes()
+
+    def __len__(self):
+        # Like that of a StructBase, the size of the data it was read from
+        return self._owner._stream_len  # type: ignore
+
+    def __contains__(self, key: str):
+        return key in self._struct.PROPS
+
+    def __getitem__(self, key: str):
+        if isinstance(self._struct.PROPS[key], int):
+            return self._record[key].tobytes()
+        return self._record[key].item()
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._struct.PROPS:
+            raise KeyError(key)
+
+        self._record[key] = value
+        self._owner._changed()
+
+    @property
+    def SIZE(self) -> int:  # pylint: disable=invalid-name
+        return self._struct.SIZE
+
+
 class ListEventBase(DataEventBase, Iterable[StructBase]):
-    """Base class for events storing an array of structured data."""
+    """Base class for events storing an array of structured data.
+
+    Items are created only when they are accessed. If NumPy is installed,
+    the data is viewed as a structured array (see :attr:`array`) and items
+    are :class:`StructView` objects into it, otherwise each item is a
+    :class:`StructBase` read from the event's stream.
+    """
+
+    __slots__ = ("unparsed", "_array", "_items")
 
     STRUCT: ClassVar[type[StructBase]]
 
     def __init__(self, id: int, data: bytes):
         super().__init__(id, data)
-        self.items: list[StructBase] = []
         self.unparsed = False
+        self._array: numpy.ndarray | None = None
 
         size = type(self).STRUCT.SIZE
-
-        # ? Make this lazily evaluated
+        count = 0
         if not self._stream_len % size:
-            for _ in range(int(self._stream_len / size)):
-                self.items.append(type(self).STRUCT(self._stream))
+            count = self._stream_len // size
         else:
             self.unparsed = True
             warnings.warn(
                 f"Cannot parse event {id} as event "
                 "size is not a multiple of struct size"
             )
+        self._items: list[StructBase | StructView | None] = [None] * count
 
-    def __getitem__(self, index: SupportsIndex):
-        return self.items[index]
+    def __getitem__(self, index: SupportsIndex | slice):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+
+        item = self._items[index]
+        if item is None:
+            index = index.__index__()
+            if index < 0:
+                index += len(self._items)
+
+            struct = type(self).STRUCT
+            if numpy is not None:
+                item = StructView(struct, self._get_array()[index], self)
+            else:
+                self._stream.seek(index * struct.SIZE)
+                item = struct(self._stream, self)
+            self._items[index] = item
+        return item
 
     def __setitem__(self, index: SupportsIndex, item: StructBase):
-        self.items[index] = item
+        self._items[index] = item
+        self._changed()
 
     def __iter__(self):
-        return iter(self.items)
+        for index in range(len(self._items)):
+            yield self[index]
 
     def __repr__(self):
         cls = type(self).__name__
         size = self._stream_len
-        num_items = len(self.items)
+        num_items = len(self._items)
         return f"{cls} (id={self.id!r}, size={size}, {num_items} items)"
 
+    @property
+    def array(self) -> numpy.ndarray:
+        """A writable NumPy structured array of the items; requires NumPy.
+
+        Its dtype is given by :meth:`StructBase.dtype` and it views the event
+        data directly, so changes made to it get saved. Since those changes
+        can't be tracked, accessing it marks the event as changed.
+
+        Raises:
+            ModuleNotFoundError: When NumPy isn't installed.
+        """
+        array = self._get_array()
+        self._changed()
+        return array
+
+    def _get_array(self) -> numpy.ndarray:
+        if self._array is None:
+            if numpy is None:
+                raise ModuleNotFoundError("NumPy is required for array access")
+
+            # The data is kept in a bytearray which the array views.
+            if self._lazy_stream is not None:
+                self._raw = self._lazy_stream.getvalue()
+                self._lazy_stream = None
+            self._raw = bytearray(self._raw)
+            self._array = numpy.frombuffer(
+                self._raw, type(self).STRUCT.dtype(), len(self._items)
+            )
+        return self._array
+
+    @property
+    def items(self) -> list[StructBase | StructView]:
+        """All the items; creates the ones which haven't been accessed yet.
+
+        The same list is returned every time, so changes made to it persist.
+        """
+        for index, item in enumerate(self._items):
+            if item is None:
+                self[index]
+        return cast("list[StructBase | StructView]", self._items)
+
+    @items.setter
+    def items(self, value: list[StructBase | StructView]):
+        self._items = value
+
 
 class UnknownDataEvent(DataEventBase):
-    """Used for events whose structure is unknown as of yet."""
+    """Used for events whose structure is unknown as of yet.
+
+    Its value is a `memoryview` when parsed with `mmap=True`, until changed.
+    """
+
+    __slots__ = ()
 
     @property
     def value(self):
@@ -636,17 +942,223 @@ class UnknownDataEvent(DataEventBase):
 
     @value.setter
     def value(self, value: bytes):
+        self._lazy_stream = None
         self._raw = value
+        self._changed()
+
+
+class EventTable(Sequence[AnyEvent]):
+    """An offset table of the events in a buffer; events are created lazily.
+
+    Stores the ID, data offset, data size and type of every event in compact
+    arrays. An event object is created from its data only when it is first
+    accessed and is reused after that.
+    """
+
+    def __init__(self, buf: bytes | memoryview, start: int = 0):
+        """
+        Args:
+            buf (bytes | memoryview): The buffer containing the events.
+                If this is a `memoryview`, data events get a view of their
+                data instead of a copy.
+            start (int): Offset of the first event in `buf`.
+        """
+        self.ids = array.array("B")
+        """Event IDs in the order of their occurence."""
+
+        self._buf = buf
+        self._start = start
+        self._nbytes = 0
+        self._offsets = array.array("I")
+        self._sizes = array.array("I")
+        self._type_ids = array.array("B")
+        self._types: list[type[AnyEvent]] = []
+        self._type_indexes: dict[type[AnyEvent], int] = {}
+        self._events: list[AnyEvent | None] = []
+
+    def __getitem__(self, index: SupportsIndex | slice):  # type: ignore
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+
+        event = self._events[index]
+        if event is None:
+            start = self._offsets[index]
+            end = start + self._sizes[index]
+            data = self._buf[start:end]
+            event_type = self._types[self._type_ids[index]]
+            if isinstance(data, memoryview) and not issubclass(
+                event_type, DataEventBase
+            ):
+                data = bytes(data)
+            event = self._events[index] = event_type(self.ids[index], data)
+            if isinstance(event, VarintEventBase):
+                event._size = start + self._sizes[index] - self._event_start(index)
+                event._on_resize = self._resize
+        return event
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getstate__(self):
+        """Pickles the events as a single buffer, instead of the objects.
+
+        Changed events are serialised into the buffer, so that the changes
+        are preserved.
+        """
+        state = {"ids": self.ids, "type_ids": self._type_ids, "types": self._types}
+        if not any(event is not None and event._dirty for event in self._events):
+            state.update(
+                buf=bytes(self._buf),
+                start=self._start,
+                offsets=self._offsets,
+                sizes=self._sizes,
+            )
+            return state
+
+        view = memoryview(self._buf)
+        chunks: list[bytes | memoryview] = []
+        offsets = array.array("I")
+        sizes = array.array("I")
+        pos = 0
+        prev_end = self._start
+        for index, event in enumerate(self._events):
+            end = self._offsets[index] + self._sizes[index]
+            if event is None or not event._dirty:
+                chunks.append(view[prev_end:end])
+                offsets.append(pos + self._offsets[index] - prev_end)
+                sizes.append(self._sizes[index])
+                pos += end - prev_end
+            else:
+                data = bytes(event)  # also syncs `_raw`
+                chunks.append(data)
+                offsets.append(pos + len(data) - len(event._raw))
+                sizes.append(len(event._raw))
+                pos += len(data)
+            prev_end = end
+
+        state.update(buf=b"".join(chunks), start=0, offsets=offsets, sizes=sizes)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self._buf = state.pop("buf")
+        self._start = state.pop("start")
+        self._restore(**state)
+
+    def _event_start(self, index: int) -> int:
+        """Offset of the ID of an event, i.e. where the previous one ends."""
+        if not index:
+            return self._start
+        return self._offsets[index - 1] + self._sizes[index - 1]
+
+    def _resize(self, delta: int):
+        self._nbytes += delta
+
+    def _restore(
+        self,
+        ids: array.array[int],
+        offsets: array.array[int],
+        sizes: array.array[int],
+        type_ids: array.array[int],
+        types: list[type[AnyEvent]],
+    ):
+        """Replaces the contents of the table with a previously scanned one."""
+        self.ids = ids
+        self._offsets = offsets
+        self._sizes = sizes
+        self._type_ids = type_ids
+        self._types = types
+        self._type_indexes = {type: i for i, type in enumerate(types)}
+        self._events = [None] * len(ids)
+        self._nbytes = self._event_start(len(ids)) - self._start
+
+    def append(self, id: int, offset: int, size: int, type: type[AnyEvent]):
+        """Adds an event whose data of `size` bytes begins at `offset`."""
+        type_index = self._type_indexes.get(type)
+        if type_index is None:
+            type_index = self._type_indexes[type] = len(self._types)
+            self._types.append(type)
+
+        self.ids.append(id)
+        self._offsets.append(offset)
+        self._sizes.append(size)
+        self._type_ids.append(type_index)
+        self._events.append(None)
+        self._nbytes = offset + size - self._start
+
+    def asdict(self) -> dict[int, Sequence[AnyEvent]]:
+        """Groups events by their IDs without creating any of them."""
+        indexes: dict[int, list[int]] = collections.defaultdict(list)
+        for index, id in enumerate(self.ids):
+            indexes[id].append(index)
+        return {id: _EventTableView(self, idxs) for id, idxs in indexes.items()}
+
+    def segments(self) -> list[memoryview | AnyEvent]:
+        """Splits the events into ranges of unchanged bytes and changed events.
+
+        Events which haven't been created or changed since are represented
+        by a view of their bytes in the buffer; consecutive ones are merged
+        into a single view.
+        """
+        view = memoryview(self._buf)
+        segments: list[memoryview | AnyEvent] = []
+        span_start = prev_end = self._start
+        for index, event in enumerate(self._events):
+            end = self._offsets[index] + self._sizes[index]
+            if event is not None and event._dirty:
+                if span_start < prev_end:
+                    segments.append(view[span_start:prev_end])
+                segments.append(event)
+                span_start = end
+            prev_end = end
+
+        if span_start < prev_end:
+            segments.append(view[span_start:prev_end])
+        return segments
+
+    def sizeof(self) -> int:
+        """Total size of the events, including changes made to them (in bytes)."""
+        return self._nbytes
+
+    def materialize(self):
+        """Creates all the events which haven't been accessed yet."""
+        for index, event in enumerate(self._events):
+            if event is None:
+                self[index]
+
+
+class _EventTableView(Sequence[AnyEvent]):
+    """A subset of the events of an :class:`EventTable`."""
+
+    def __init__(self, table: EventTable, indexes: list[int]):
+        self._table = table
+        self._indexes = indexes
+
+    def __getitem__(self, index: SupportsIndex | slice):  # type: ignore
+        if isinstance(index, slice):
+            return [self._table[i] for i in self._indexes[index]]
+        return self._table[self._indexes[index]]
+
+    def __len__(self):
+        return len(self._indexes)
 
 
 class EventEnumMeta(enum.EnumMeta):
-    def __contains__(self, id: int):
-        try:
-            self(id)  # type: ignore
-        except ValueError:
-            return False
-        else:
-            return True
+    _ids: frozenset[int]
+
+    def __new__(mcs, *args: Any, **kwds: Any):
+        cls = super().__new__(mcs, *args, **kwds)
+        # Membership tests are done for almost every event, hence precomputed.
+        cls._ids = frozenset(member.value for member in cls)
+        return cls
+
+    def __contains__(self, id: object):
+        return id in self._ids
 
 
 class EventEnum(int, enum.Enum, metaclass=EventEnumMeta):
@@ -18,13 +18,21 @@ from __future__ import annotations
 import abc
 import collections
 import dataclasses
+import sys
 from collections.abc import Hashable
-from typing import Any, DefaultDict, Generic, TypeVar
+from typing import Any, DefaultDict, Generic, Tuple, TypeVar, cast
 
-from ._events import AnyEvent, StructBase
+if sys.version_info >= (3, 9):
+    from collections.abc import Sequence
+else:
+    from typing import Sequence
+
+from ._events import AnyEvent, EventTable, StructBase
 
 
 class ModelBase(abc.ABC):
+    __slots__ = ("_kw",)
+
     def __init__(self, **kw: Any):
         self._kw = kw
 
@@ -44,6 +52,8 @@ ST = TypeVar("ST", bound=StructBase)
 class ItemModel(ModelBase, Generic[ST]):
     """Base class for event-less models."""
 
+    __slots__ = ("_item",)
+
     def __init__(self, item: ST, **kw: Any):
         self._item = item
         super().__init__(**kw)
@@ -61,6 +71,8 @@ class ItemModel(ModelBase, Generic[ST]):
 class SingleEventModel(ModelBase, Hashable):
     """Base class for models whose properties are derived from a single event."""
 
+    __slots__ = ("_event",)
+
     def __init__(self, event: AnyEvent, **kw: Any):
         super().__init__(**kw)
         self._event = event
@@ -88,13 +100,28 @@ class SingleEventModel(ModelBase, Hashable):
 
 
 class MultiEventModel(ModelBase, Hashable):
-    def __init__(self, *events: AnyEvent, **kw: Any):
+    __slots__ = ("_events", "_events_tuple")
+
+    def __init__(self, *events: AnyEvent | EventTable, **kw: Any):
+        """
+        Args:
+            *events (AnyEvent | EventTable): The events used by the model or
+                a single :class:`EventTable` whose events get created only
+                when the model needs them.
+        """
         super().__init__(**kw)
-        self._events: dict[int, list[AnyEvent]] = {}
-        self._events_tuple = events
+        self._events: dict[int, Sequence[AnyEvent]] = {}
+        self._events_tuple: Sequence[AnyEvent]
+
+        if len(events) == 1 and isinstance(events[0], EventTable):
+            self._events_tuple = events[0]
+            self._events.update(events[0].asdict())
+            return
+
+        self._events_tuple = cast(Tuple[AnyEvent, ...], events)
         tmp: DefaultDict[int, list[AnyEvent]] = collections.defaultdict(list)
 
-        for event in events:
+        for event in self._events_tuple:
             if event is not None:
                 tmp[event.id].append(event)
         self._events.update(tmp)
@@ -108,21 +135,43 @@ class MultiEventModel(ModelBase, Hashable):
     def __hash__(self) -> int:
         return hash(self.events_astuple())
 
-    def events_astuple(self):
+    def __reduce__(self):
+        return _rebuild_model, (type(self), self._events_tuple, self._kw)
+
+    def events_astuple(self) -> tuple[AnyEvent, ...]:
         """Returns a tuple of events used by the model in their original order."""
-        return self._events_tuple
+        return tuple(self._events_tuple)
+
+    def _event_ids(self) -> Sequence[int]:
+        """Returns the IDs of the events used by the model without creating them."""
+        if isinstance(self._events_tuple, EventTable):
+            return self._events_tuple.ids
+        return [event.id for event in self._events_tuple]
 
     def events_asdict(self):
         """Returns a dictionary of event ID to a list of events."""
         return self._events
 
     def sizeof(self) -> int:
+        if isinstance(self._events_tuple, EventTable):
+            return self._events_tuple.sizeof()
         return sum(len(event) for event in self._events_tuple)
 
 
+def _rebuild_model(
+    cls: type[MultiEventModel], events: Sequence[AnyEvent], kw: dict[str, Any]
+):
+    """Unpickles a :class:`MultiEventModel`, see its `__reduce__` method."""
+    if isinstance(events, EventTable):
+        return cls(events, **kw)
+    return cls(*events, **kw)
+
+
 class ModelReprMixin:
     """I am too lazy to make one `__repr__()` for every model."""
 
+    __slots__ = ()
+
     def __repr__(self):
         mapping: dict[str, Any] = {}
         cls = type(self)
@@ -74,6 +74,7 @@ __all__ = [
 
 
 class _PlaylistItemStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "position": "I",  # 4
         "pattern_base": "H",  # 6
@@ -90,6 +91,7 @@ class _PlaylistItemStruct(StructBase):
 
 
 class _TrackStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "index": "I",  # 4
         "color": "i",  # 8
@@ -111,10 +113,12 @@ class _TrackStruct(StructBase):
 
 
 class PlaylistEvent(ListEventBase):
+    __slots__ = ()
     STRUCT = _PlaylistItemStruct
 
 
 class TrackEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _TrackStruct
 
 
@@ -187,6 +191,8 @@ class TimeMarkerType(enum.IntEnum):
 
 
 class PlaylistItemBase(ItemModel[_PlaylistItemStruct]):
+    __slots__ = ()
+
     def __repr__(self):
         return "{} @ {} of length {} in group {}".format(
             type(self).__name__, self.position, self.length, self.group
@@ -210,6 +216,8 @@ class ChannelPlaylistItem(PlaylistItemBase):
     *New in FL Studio v2.0.1*.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         if self.channel is None:
             return super().__repr__()
@@ -224,6 +232,8 @@ class PatternPlaylistItem(PlaylistItemBase):
     *New in FL Studio v7.0.0*.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         if self.pattern is None:
             return super().__repr__()
@@ -235,6 +245,8 @@ class PatternPlaylistItem(PlaylistItemBase):
 class TimeMarker(MultiEventModel):
     """A marker in the timeline of an :class:`Arrangement`."""
 
+    __slots__ = ()
+
     def __repr__(self):
         if self.type == TimeMarkerType.Marker:
             if self.name:
@@ -294,6 +306,8 @@ class Track(MultiEventModel, Iterable[PlaylistItemBase], SupportsIndex):
     ![](https://bit.ly/3de6R8y)
     """
 
+    __slots__ = ()
+
     def __init__(self, *events: AnyEvent, **kw: Unpack[_TrackKW]):
         super().__init__(*events, **kw)
 
@@ -393,8 +407,11 @@ class Arrangement(MultiEventModel, SupportsIndex):
     *New in FL Studio v12.9.1*: Support for multiple arrangements.
     """
 
+    __slots__ = ("_playlist_buckets",)
+
     def __init__(self, *events: AnyEvent, **kw: Unpack[_ArrangementKW]):
         super().__init__(*events, **kw)
+        self._playlist_buckets: DefaultDict[int, list[PlaylistItemBase]] | None = None
 
     def __repr__(self):
         timemarkers = f"{len(tuple(self.timemarkers))} timemarkers"
@@ -435,27 +452,35 @@ class Arrangement(MultiEventModel, SupportsIndex):
         for events in self._collect_events(TimeMarkerID):
             yield TimeMarker(*events)
 
-    @property
-    def tracks(self) -> Iterator[Track]:
-        count = 0
-        pl_event = None
-        max_idx = 499 if dataclasses.astuple(self._kw["version"]) >= (12, 9, 1) else 198
+    def _track_items(self) -> DefaultDict[int, list[PlaylistItemBase]]:
+        """Playlist items grouped by the track they are on, in a single pass.
 
-        if ArrangementID.Playlist in self._events:
-            pl_event = cast(PlaylistEvent, self._events[ArrangementID.Playlist][0])
+        The groups are cached; tracks are numbered from 0, in the order their
+        events occur, while the `track_index` of an item counts backwards.
+        """
+        if self._playlist_buckets is None:
+            buckets: DefaultDict[int, list[PlaylistItemBase]]
+            buckets = self._playlist_buckets = collections.defaultdict(list)
+            if ArrangementID.Playlist in self._events:
+                version = dataclasses.astuple(self._kw["version"])
+                max_idx = 499 if version >= (12, 9, 1) else 198
+                pl_event = cast(PlaylistEvent, self._events[ArrangementID.Playlist][0])
+                for item in pl_event:
+                    buckets[max_idx - item["track_index"]].append(
+                        PlaylistItemBase(cast(_PlaylistItemStruct, item))
+                    )
+        return self._playlist_buckets
 
-        for events in self._collect_events(TrackID):
-            items: list[PlaylistItemBase] = []
-            if pl_event is not None:
-                for item in pl_event.items:
-                    idx = item["track_index"]
-                    if max_idx - idx == count:
-                        items.append(PlaylistItemBase(cast(_PlaylistItemStruct, item)))
-            yield Track(*events, items=items)
-            count += 1
+    @property
+    def tracks(self) -> Iterator[Track]:
+        buckets = self._track_items()
+        for count, events in enumerate(self._collect_events(TrackID)):
+            yield Track(*events, items=buckets.get(count, []))
 
 
 class TimeSignature(MultiEventModel):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"Global time signature: {self.num}/{self.beat}"
 
@@ -466,8 +491,11 @@ class TimeSignature(MultiEventModel):
 class Arrangements(MultiEventModel, Sequence[Arrangement]):
     """Iterator over arrangements in the project and some related properties."""
 
+    __slots__ = ("_arrangements",)
+
     def __init__(self, *events: AnyEvent, **kw: Unpack[_ArrangementKW]):
         super().__init__(*events, **kw)
+        self._arrangements: list[Arrangement] | None = None
 
     def __getitem__(self, index: SupportsIndex) -> Arrangement:
         """Returns the arrangement at :attr:`Arrangement.index`.
@@ -492,6 +520,10 @@ class Arrangements(MultiEventModel, Sequence[Arrangement]):
         Raises:
             NoModelsFound: When no arrangements are found.
         """
+        if self._arrangements is not None:
+            yield from self._arrangements
+            return
+
         arrs_evs: list[list[AnyEvent]] = [[] for _ in range(len(self))]
         idx = 0
         for event in self._events_tuple:
@@ -502,8 +534,10 @@ class Arrangements(MultiEventModel, Sequence[Arrangement]):
                 if event.id in enum_:
                     arrs_evs[idx].append(event)
 
-        for arr_evs in arrs_evs:
-            yield Arrangement(*arr_evs, version=self._kw["version"])
+        self._arrangements = [
+            Arrangement(*arr_evs, version=self._kw["version"]) for arr_evs in arrs_evs
+        ]
+        yield from self._arrangements
 
     def __len__(self):
         """The number of arrangements present in the project.
@@ -0,0 +1,261 @@
+# PyFLP - An FL Studio project file (.flp) parser
+# Copyright (C) 2022 demberto
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+# Public License for more details. You should have received a copy of the
+# GNU General Public License along with this program. If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Contains :class:`ParseCache`, an opt-in on-disk cache of scanned projects.
+
+A cache entry holds the event offset table, the resolved event types and the
+header fields of a file, so that parsing it again skips scanning its events.
+
+    >>> cache = pyflp.cache.ParseCache("/path/to/cache")
+    >>> project = pyflp.parse("/path/to/parse.flp", cache=cache)
+"""
+
+from __future__ import annotations
+
+import array
+import contextlib
+import hashlib
+import importlib
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+from typing import NamedTuple
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+from ._events import AnyEvent, EventBase, EventTable
+
+__all__ = ["CachedScan", "ParseCache"]
+
+_MAGIC: Final = b"PFLC\x01"
+_HEADER: Final = struct.Struct("<16shHHIII")  # digest, header fields, table sizes
+_SUFFIX: Final = ".scan"
+
+
+class CachedScan(NamedTuple):
+    """The header fields and event table of a file loaded from the cache."""
+
+    format: int
+    channel_count: int
+    ppq: int
+    table: EventTable
+
+
+def _type_name(type: type[AnyEvent]) -> str:
+    return f"{type.__module__}:{type.__qualname__}"
+
+
+def _resolve_type(name: str) -> type[AnyEvent]:
+    """Imports an event type from its name; only PyFLP's own types are allowed."""
+    module, _, qualname = name.partition(":")
+    if module.partition(".")[0] != "pyflp":
+        raise ValueError(f"{name!r} is not an event type of PyFLP")
+
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    if not isinstance(obj, type) or not issubclass(obj, EventBase):
+        raise ValueError(f"{name!r} is not an event type")
+    return obj
+
+
+def _little_endian(arr: array.array[int]) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _read_array(typecode: str, data: bytes, count: int) -> array.array[int]:
+    arr = array.array(typecode)
+    arr.frombytes(data)
+    if len(arr) != count:
+        raise ValueError("Truncated cache entry")
+    if sys.byteorder == "big":  # pragma: no cover
+        arr.byteswap()
+    return arr
+
+
+class ParseCache:
+    """Stores scanned projects in a directory, bounded by their total size.
+
+    An entry is looked up by the path, size and modification time of a file
+    and is used only if the hash of the file's contents matches too. Entries
+    are evicted least recently used first, once their total size exceeds
+    `max_size`. Entries are stored in a simple binary format; event types are
+    saved by name and only PyFLP's own types are loaded back.
+
+    Args:
+        directory (str | pathlib.Path): Where entries are stored; gets
+            created if it doesn't exist.
+        max_size (int, 64 MiB): Total size of entries (in bytes) to keep.
+    """
+
+    def __init__(self, directory: str | pathlib.Path, max_size: int = 64 << 20):
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entry(self, file: str | os.PathLike[str], stat: os.stat_result, tag: str):
+        key = f"{os.path.abspath(file)}\0{stat.st_size}\0{stat.st_mtime_ns}\0{tag}"
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / (name + _SUFFIX)
+
+    def load(
+        self,
+        file: str | os.PathLike[str],
+        stat: os.stat_result,
+        buf: bytes | memoryview,
+        tag: str = "",
+    ) -> CachedScan | None:
+        """Returns the cached scan of `buf`, read from `file`, if any.
+
+        Args:
+            file: The path `buf` was read from.
+            stat: Result of :func:`os.stat` for `file`.
+            buf: Contents of `file`. The returned table references it.
+            tag: Distinguishes scans of the same file made differently.
+
+        Returns:
+            CachedScan | None: None if there isn't an entry for `file`, if
+                its contents have changed or the entry is unreadable.
+        """
+        entry = self._entry(file, stat, tag)
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            scan = self._decode(data, buf)
+        except (ValueError, struct.error, ImportError, AttributeError):
+            scan = None
+
+        if scan is None:
+            with contextlib.suppress(OSError):
+                entry.unlink()
+        else:
+            with contextlib.suppress(OSError):
+                os.utime(entry)  # Marks the entry as recently used
+        return scan
+
+    def store(
+        self,
+        file: str | os.PathLike[str],
+        stat: os.stat_result,
+        format: int,
+        channel_count: int,
+        ppq: int,
+        table: EventTable,
+        tag: str = "",
+    ):
+        """Saves the scan of `file` and evicts entries over the size limit.
+
+        Args:
+            file: The path `table` was scanned from.
+            stat: Result of :func:`os.stat` for `file`.
+            format: Header field of `file`.
+            channel_count: Header field of `file`.
+            ppq: Header field of `file`.
+            table: The scanned events of `file`.
+            tag: Distinguishes scans of the same file made differently.
+        """
+        # pylint: disable=protected-access
+        names = "\0".join(_type_name(t) for t in table._types).encode()
+        header = _HEADER.pack(
+            hashlib.blake2b(table._buf, digest_size=16).digest(),
+            format,
+            channel_count,
+            ppq,
+            table._start,
+            len(table),
+            len(names),
+        )
+
+        entry = self._entry(file, stat, tag)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, suffix=".tmp", delete=False
+        ) as tmp:
+            try:
+                tmp.write(_MAGIC + header + names)
+                tmp.write(table.ids.tobytes())
+                tmp.write(table._type_ids.tobytes())
+                tmp.write(_little_endian(table._offsets))
+                tmp.write(_little_endian(table._sizes))
+            except BaseException:
+                tmp.close()
+                os.remove(tmp.name)
+                raise
+        os.replace(tmp.name, entry)
+        self._evict()
+
+    def clear(self):
+        """Removes all the entries."""
+        for entry in self.directory.glob("*" + _SUFFIX):
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+    def _evict(self):
+        entries: list[tuple[float, int, pathlib.Path]] = []
+        for entry in self.directory.glob("*" + _SUFFIX):
+            with contextlib.suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                entry.unlink()
+            total -= size
+
+    @staticmethod
+    def _decode(data: bytes, buf: bytes | memoryview) -> CachedScan | None:
+        if not data.startswith(_MAGIC):
+            return None
+
+        pos = len(_MAGIC)
+        fields = _HEADER.unpack_from(data, pos)
+        digest, format, channel_count, ppq, start, count, names_len = fields
+        if digest != hashlib.blake2b(buf, digest_size=16).digest():
+            return None
+
+        # Ends of the type names and the ID, type ID, offset and size arrays
+        pos += _HEADER.size
+        names_end = pos + names_len
+        ids_end = names_end + count
+        type_ids_end = ids_end + count
+        offsets_end = type_ids_end + 4 * count
+        sizes_end = offsets_end + 4 * count
+
+        names = data[pos:names_end].decode()
+        types = [_resolve_type(name) for name in names.split("\0")] if names else []
+        ids = _read_array("B", data[names_end:ids_end], count)
+        type_ids = _read_array("B", data[ids_end:type_ids_end], count)
+        offsets = _read_array("I", data[type_ids_end:offsets_end], count)
+        sizes = _read_array("I", data[offsets_end:sizes_end], count)
+        if count and max(type_ids) >= len(types):
+            raise ValueError("Invalid event type index")
+
+        table = EventTable(buf, start)
+        table._restore(  # pylint: disable=protected-access
+            ids, offsets, sizes, type_ids, types
+        )
+        return CachedScan(format, channel_count, ppq, table)
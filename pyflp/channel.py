@@ -19,7 +19,7 @@ import collections
 import enum
 import pathlib
 import sys
-from typing import DefaultDict, List, Tuple, cast
+from typing import Any, DefaultDict, List, Tuple, cast
 
 if sys.version_info >= (3, 8):
     from typing import Final, SupportsIndex
@@ -97,10 +97,12 @@ class ChannelNotFound(ModelNotFound, KeyError):
 
 
 class _DelayStruct(StructBase):
+    __slots__ = ()
     PROPS = dict.fromkeys(("feedback", "pan", "pitch_shift", "echoes", "time"), "I")
 
 
 class _EnvelopeLFOStruct(StructBase):  # 2.5.0+
+    __slots__ = ()
     PROPS = {
         "flags": "i",  # 4
         "envelope.enabled": "i",  # 8
@@ -119,14 +121,17 @@ class _EnvelopeLFOStruct(StructBase):  # 2.5.0+
 
 
 class _LevelAdjustsStruct(StructBase):
+    __slots__ = ()
     PROPS = {"pan": "I", "volume": "I", "_u4": 4, "mod_x": "I", "mod_y": "I"}
 
 
 class _LevelsStruct(StructBase):
+    __slots__ = ()
     PROPS = {"pan": "I", "volume": "I", "pitch_shift": "I", "_u12": 12}
 
 
 class _ParametersStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "_u40": 40,  # 40
         "arp.direction": "I",  # 44
@@ -148,38 +153,47 @@ class _ParametersStruct(StructBase):
 
 
 class _PolyphonyStruct(StructBase):
+    __slots__ = ()
     PROPS = {"max": "I", "slide": "I", "flags": "B"}
 
 
 class _TrackingStruct(StructBase):
+    __slots__ = ()
     PROPS = {"middle_value": "i", "pan": "i", "mod_x": "i", "mod_y": "i"}
 
 
 class DelayEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _DelayStruct
 
 
 class EnvelopeLFOEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _EnvelopeLFOStruct
 
 
 class LevelAdjustsEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _LevelAdjustsStruct
 
 
 class LevelsEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _LevelsStruct
 
 
 class ParametersEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _ParametersStruct
 
 
 class PolyphonyEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _PolyphonyStruct
 
 
 class TrackingEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _TrackingStruct
 
 
@@ -372,6 +386,8 @@ class DeclickMode(enum.IntEnum):
 
 
 class DisplayGroup(MultiEventModel, ModelReprMixin):
+    __slots__ = ()
+
     def __repr__(self):
         if self.name is None:
             return "Unnamed display group"
@@ -386,6 +402,8 @@ class Arp(SingleEventModel, ModelReprMixin):
     ![](https://bit.ly/3Lbk7Yi)
     """
 
+    __slots__ = ()
+
     chord = StructProp[int]()
     """Index of the selected arpeggio chord."""
 
@@ -417,6 +435,8 @@ class Delay(SingleEventModel, ModelReprMixin):
     ![](https://bit.ly/3RyzbBD)
     """
 
+    __slots__ = ()
+
     # is_fat_mode: Optional[bool] = None    #: 3.4.0+
     # is_ping_pong: Optional[bool] = None   #: 1.7.6+
     # mod_x: Optional[int] = None
@@ -441,6 +461,8 @@ class LevelAdjusts(SingleEventModel, ModelReprMixin):
     *New in FL Studio v3.3.0*.
     """
 
+    __slots__ = ()
+
     mod_x = StructProp[int]()
     mod_y = StructProp[int]()
     pan = StructProp[int]()
@@ -453,6 +475,8 @@ class Time(MultiEventModel, ModelReprMixin):
     ![](https://bit.ly/3xjxUGG)
     """
 
+    __slots__ = ()
+
     swing = EventProp[int](ChannelID.Swing)
     # gate: int
     # shift: int
@@ -467,6 +491,8 @@ class Reverb(SingleEventModel, ModelReprMixin):
     *New in FL Studio v1.4.0*.
     """
 
+    __slots__ = ()
+
     @property
     def type(self) -> ReverbType | None:
         if self._event:
@@ -508,6 +534,8 @@ class FX(MultiEventModel, ModelReprMixin):
         :attr:`Sampler.fx`
     """
 
+    __slots__ = ()
+
     boost = EventProp[int](ChannelID.Preamp)
     """Pre-amp gain. Defaults to minimum value.
 
@@ -578,6 +606,8 @@ class Envelope(SingleEventModel, ModelReprMixin):
     *New in FL Studio v2.5.0*.
     """
 
+    __slots__ = ()
+
     enabled = StructProp[bool](prop="envelope.enabled")
     """Whether envelope section is enabled."""
 
@@ -688,6 +718,8 @@ class LFO(SingleEventModel, ModelReprMixin):
     *New in FL Studio v2.5.0*.
     """
 
+    __slots__ = ()
+
     # amount: Optional[int] = None
     # attack: Optional[int] = None
     # predelay: Optional[int] = None
@@ -709,6 +741,8 @@ class Polyphony(SingleEventModel, ModelReprMixin):
     ![](https://bit.ly/3DlvWcl)
     """
 
+    __slots__ = ()
+
     is_mono = FlagProp(_PolyphonyFlags.Mono)
     is_porta = FlagProp(_PolyphonyFlags.Porta)
     """*New in FL Studio v3.3.0*."""
@@ -726,6 +760,8 @@ class Tracking(SingleEventModel, ModelReprMixin):
     *New in FL Studio v3.3.0*.
     """
 
+    __slots__ = ()
+
     middle_value = StructProp[int]()
     mod_x = StructProp[int]()
     mod_y = StructProp[int]()
@@ -740,6 +776,8 @@ class Keyboard(MultiEventModel, ModelReprMixin):
     *New in FL Studio v1.3.56*.
     """
 
+    __slots__ = ()
+
     fine_tune = EventProp[int](ChannelID.FineTune)
     """-100 to +100 cents."""
 
@@ -764,6 +802,8 @@ class Playback(MultiEventModel, ModelReprMixin):
     ![](https://bit.ly/3xjSypY)
     """
 
+    __slots__ = ()
+
     ping_pong_loop = EventProp[bool](ChannelID.PingPongLoop)
     start_offset = StructProp[int](ChannelID.Parameters, prop="playback.start_offset")
     """Linear. Defaults to minimum value.
@@ -785,6 +825,8 @@ class TimeStretching(MultiEventModel, ModelReprMixin):
     *New in FL Studio v5.0*.
     """
 
+    __slots__ = ()
+
     mode = StructProp[StretchMode](ChannelID.Parameters, prop="stretching.mode")
     # multiplier: Optional[int] = None
     # pitch: Optional[int] = None
@@ -794,6 +836,8 @@ class TimeStretching(MultiEventModel, ModelReprMixin):
 class Content(MultiEventModel, ModelReprMixin):
     """Used by :class:`Sampler`."""
 
+    __slots__ = ()
+
     declick_mode = StructProp[DeclickMode](
         ChannelID.Parameters, prop="content.declick_mode"
     )
@@ -806,6 +850,8 @@ class Content(MultiEventModel, ModelReprMixin):
 class Channel(MultiEventModel, SupportsIndex):
     """Represents a channel in the channel rack."""
 
+    __slots__ = ()
+
     def __repr__(self):
         if self.display_name is None:
             return f"Unnamed {type(self).__name__.lower()} #{self.iid}"
@@ -839,7 +885,22 @@ class Channel(MultiEventModel, SupportsIndex):
     """Display group / filter under which this channel is grouped."""
 
     icon = EventProp[int](PluginID.Icon)
-    iid = EventProp[int](ChannelID.New)
+    _iid = EventProp[int](ChannelID.New)
+
+    @property
+    def iid(self) -> int | None:
+        """Internal index of the channel, by which the rack looks it up."""
+        return self._iid
+
+    @iid.setter
+    def iid(self, value: int):
+        # Keeps the map of the rack (shared by all its channels) up to date
+        channels: dict[int, Channel] | None = self._kw.get("channels")
+        if channels is not None and channels.get(self._iid) is self:
+            del channels[self._iid]
+            channels[value] = self
+        self._iid = value
+
     keyboard = NestedProp(Keyboard, ChannelID.FineTune, ChannelID.RootNote)
     locked = EventProp[bool](ChannelID.IsLocked)
     """![](https://bit.ly/3BOBc7j)"""
@@ -938,6 +999,8 @@ class Automation(Channel):
     ![](https://bit.ly/3RXQhIN)
     """
 
+    __slots__ = ()
+
 
 class Layer(Channel, Sequence[Channel]):
     """Represents a layer channel present in the channel rack.
@@ -947,21 +1010,41 @@ class Layer(Channel, Sequence[Channel]):
     *New in FL Studio v3.4.0*.
     """
 
+    __slots__ = ("_positions",)
+
+    def __init__(self, *events: AnyEvent, **kw: Any):
+        super().__init__(*events, **kw)
+        self._positions: dict[int, int] | None = None
+
     def __getitem__(self, index: str | SupportsIndex):
         """Returns a child channel with an IID / index of :attr:`~Channel.iid`.
 
         Args:
-            index (str | SupportsIndex): An IID or a zero based index of the child
-                channel.
+            index (str | SupportsIndex): An IID if a string, otherwise a zero
+                based index or an IID of the child channel, whichever of the
+                two children comes first.
 
         Raises:
             ChannelNotFound: A child channel with the specific index or IID
                 couldn't be found. This exception derives from `KeyError` as well.
         """
-        for idx, child in enumerate(self):
-            if index in (idx, child.iid):
-                return child
-        raise ChannelNotFound(index)
+        children = self._events.get(ChannelID.Children, [])
+        if self._positions is None:
+            self._positions = {}
+            for pos, event in enumerate(children):
+                self._positions.setdefault(event.value, pos)
+
+        if isinstance(index, str):
+            pos = self._positions.get(int(index))
+        else:
+            idx = index.__index__()
+            pos = self._positions.get(idx)
+            if 0 <= idx < len(children) and (pos is None or idx < pos):
+                pos = idx
+
+        if pos is None:
+            raise ChannelNotFound(index)
+        return self._kw["channels"][children[pos].value]
 
     def __iter__(self) -> Iterator[Channel]:
         if ChannelID.Children in self._events:
@@ -977,6 +1060,7 @@ class Layer(Channel, Sequence[Channel]):
 
 
 class _SamplerInstrument(Channel):
+    __slots__ = ()
     arp = NestedProp(Arp, ChannelID.Parameters)
     delay = NestedProp(Delay, ChannelID.Delay)
     insert = EventProp[int](ChannelID.RoutedTo)
@@ -998,6 +1082,8 @@ class _SamplerInstrument(Channel):
 class Instrument(_SamplerInstrument):
     """Represents a native or a 3rd party plugin loaded in a channel."""
 
+    __slots__ = ()
+
     plugin = PluginProp({VSTPluginEvent: VSTPlugin, BooBassEvent: BooBass})
     """The plugin loaded into the channel."""
 
@@ -1009,6 +1095,8 @@ class Sampler(_SamplerInstrument):
     ![](https://bit.ly/3DlHPiI)
     """
 
+    __slots__ = ()
+
     _ENVLFO_NAMES: Final = ("Panning", "Volume", "Mod X", "Mod Y", "Pitch")
 
     def __repr__(self):
@@ -1103,9 +1191,16 @@ class ChannelRack(MultiEventModel, Sequence[Channel]):
     ![](https://bit.ly/3RXR50h)
     """
 
+    __slots__ = ("_channels", "_iid_map")
+
     def __repr__(self) -> str:
         return f"ChannelRack - {len(self)} channels"
 
+    def __init__(self, *events: AnyEvent, **kw: Any):
+        super().__init__(*events, **kw)
+        self._channels: list[Channel] | None = None
+        self._iid_map: dict[int, Channel] = {}
+
     def __getitem__(self, index: str | SupportsIndex):
         """Gets a channel from the rack based on its IID or index.
 
@@ -1117,13 +1212,32 @@ class ChannelRack(MultiEventModel, Sequence[Channel]):
             ChannelNotFound: A :class:`Channel` with an IID or index of
                 :attr:`index` isn't found.
         """
-        for idx, channel in enumerate(self):
-            if (isinstance(index, str) and int(index) == channel.iid) or (index == idx):
+        channels = self._build()
+        if isinstance(index, str):
+            channel = self._iid_map.get(int(index))
+            if channel is not None:
                 return channel
+        else:
+            idx = index.__index__()
+            if 0 <= idx < len(channels):
+                return channels[idx]
         raise ChannelNotFound(index)
 
-    def __iter__(self):  # pylint: disable=too-complex
+    def __iter__(self) -> Iterator[Channel]:
+        yield from self._build()
+
+    def _build(self) -> list[Channel]:  # pylint: disable=too-complex
+        """Creates all the channels once and maps them by their IIDs.
+
+        Every :class:`Layer` shares the map, hence its children resolve
+        regardless of whether they are found before or after it. A channel
+        is mapped again when its IID is changed.
+        """
+        if self._channels is not None:
+            return self._channels
+
         ch_dict: dict[int, Channel] = {}
+        channels: list[Channel] = []
         events: DefaultDict[int, list[AnyEvent]] = collections.defaultdict(list)
         cur_ch_events = []
         for event in self._events_tuple:
@@ -1153,8 +1267,12 @@ class ChannelRack(MultiEventModel, Sequence[Channel]):
                     ct = Sampler  # see #40
 
             if ct is not None:
-                cur_ch = ch_dict[iid] = ct(*ch_events, channels=ch_dict)
-                yield cur_ch
+                ch_dict[iid] = ct(*ch_events, channels=ch_dict)
+                channels.append(ch_dict[iid])
+
+        self._iid_map = ch_dict
+        self._channels = channels
+        return channels
 
     def __len__(self):
         """Returns the number of channels found in the project.
@@ -25,6 +25,7 @@ __all__ = ["RemoteController"]
 
 
 class _RemoteControllerStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "_u1": 2,  # 2
         "_u2": 1,  # 3
@@ -37,6 +38,7 @@ class _RemoteControllerStruct(StructBase):
 
 
 class RemoteControllerEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _RemoteControllerStruct
 
 
@@ -51,6 +53,8 @@ class RemoteController(SingleEventModel, ModelReprMixin):
     *New in FL Studio v3.3.0*.
     """  # noqa
 
+    __slots__ = ()
+
     @property
     def parameter(self) -> int | None:
         """The ID of the plugin parameter to which controller is linked to."""
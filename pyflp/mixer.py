@@ -97,14 +97,17 @@ __all__ = [
 
 
 class _InsertFlagsStruct(StructBase):
+    __slots__ = ()
     PROPS = {"_u1": "I", "flags": "I", "_u2": "I"}
 
 
 class _InsertRoutingStruct(StructBase):
+    __slots__ = ()
     PROPS = {"is_routed": "bool"}
 
 
 class _MixerParamsItem(StructBase):
+    __slots__ = ()
     PROPS = {
         "_u4": 4,  # 4
         "id": "b",  # 5
@@ -115,14 +118,17 @@ class _MixerParamsItem(StructBase):
 
 
 class InsertFlagsEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _InsertFlagsStruct
 
 
 class InsertRoutingEvent(ListEventBase):
+    __slots__ = ()
     STRUCT = _InsertRoutingStruct
 
 
 class MixerParamsEvent(ListEventBase):
+    __slots__ = ()
     STRUCT = _MixerParamsItem
 
 
@@ -219,6 +225,8 @@ class _InsertEQBandProp(NamedPropMixin, RWProperty[int]):
 
 
 class InsertEQBand(ModelBase):
+    __slots__ = ()
+
     def __init__(self, **kw: Unpack[_InsertEQBandKW]):
         super().__init__(**kw)
 
@@ -250,6 +258,14 @@ class InsertEQBand(ModelBase):
     """
 
 
+def _map_params(params: list[_MixerParamsItem]) -> dict[int, list[_MixerParamsItem]]:
+    """Groups `params` by their IDs, in the order they are found."""
+    params_map: dict[int, list[_MixerParamsItem]] = {}
+    for param in params:
+        params_map.setdefault(param["id"], []).append(param)
+    return params_map
+
+
 class _InsertEQPropArgs(NamedTuple):
     freq: _MixerParamsID
     gain: _MixerParamsID
@@ -266,14 +282,9 @@ class _InsertEQProp(NamedPropMixin, ROProperty[InsertEQBand]):
             return NotImplemented
 
         items: _InsertEQBandKW = {}
-        for param in instance._kw["params"]:
-            id = param["id"]
-            if id == self._ids.freq:
-                items["freq"] = param
-            elif id == self._ids.gain:
-                items["gain"] = param
-            elif id == self._ids.reso:
-                items["reso"] = param
+        for key, id in zip(self._ids._fields, self._ids):
+            if id in instance._params:
+                items[key] = instance._params[id][-1]
         return InsertEQBand(**items)
 
 
@@ -287,8 +298,11 @@ class InsertEQ(ModelBase):
         :attr:`Insert.eq`
     """
 
+    __slots__ = ("_params",)
+
     def __init__(self, params: list[_MixerParamsItem]):
         super().__init__(params=params)
+        self._params = _map_params(params)
 
     def __repr__(self):
         low = f"{self.low.freq},{self.low.gain},{self.low.reso}"
@@ -297,7 +311,7 @@ class InsertEQ(ModelBase):
         return f"InsertEQ (low={low}, mid={mid}, high={high})"
 
     def sizeof(self) -> int:
-        return _MixerParamsItem.SIZE * self._kw["param"]
+        return _MixerParamsItem.SIZE * len(self._kw["params"])
 
     low = _InsertEQProp(
         _InsertEQPropArgs(
@@ -325,18 +339,17 @@ class _MixerParamProp(RWProperty[T]):
     def __init__(self, id: _MixerParamsID):  # pylint: disable=super-init-not-called
         self._id = id
 
-    def __get__(self, instance: Insert, owner: object = None) -> T | None:
+    def __get__(self, instance: Insert | Slot, owner: object = None) -> T | None:
         if owner is None:
             return NotImplemented
 
-        for param in instance._kw["params"]:
-            if param["id"] == self._id:
-                return param["msg"]
+        params = instance._params.get(self._id)
+        if params:
+            return params[0]["msg"]
 
-    def __set__(self, instance: Insert, value: T):
-        for param in instance._kw["params"]:
-            if param["id"] == self._id:
-                param["msg"] = value
+    def __set__(self, instance: Insert | Slot, value: T):
+        for param in instance._params.get(self._id, ()):
+            param["msg"] = value
 
 
 class Slot(MultiEventModel, SupportsIndex):
@@ -345,8 +358,11 @@ class Slot(MultiEventModel, SupportsIndex):
     ![](https://bit.ly/3RUDtTu)
     """
 
+    __slots__ = ("_params",)
+
     def __init__(self, *events: AnyEvent, params: list[_MixerParamsItem] | None = None):
         super().__init__(*events, params=params or [])
+        self._params = _map_params(self._kw["params"])
 
     def __repr__(self) -> str:
         repr = "Unnamed slot" if self.name is None else f"Slot {self.name!r}"
@@ -407,8 +423,19 @@ class Insert(MultiEventModel, Sequence[Slot], SupportsIndex):
     ![](https://bit.ly/3LeGKuN)
     """
 
+    __slots__ = ("_eq", "_params", "_slot_params")
+
     def __init__(self, *events: AnyEvent, **kw: Unpack[_InsertKW]):
         super().__init__(*events, **kw)
+        self._eq: InsertEQ | None = None
+        params = self._kw.get("params", [])
+        slot_params: DefaultDict[int, list[_MixerParamsItem]] = collections.defaultdict(
+            list
+        )
+        for param in params:
+            slot_params[param["channel_data"] % 0x3F].append(param)
+        self._params = _map_params(params)
+        self._slot_params = slot_params
 
     # TODO Add number of used slots
     def __repr__(self):
@@ -437,17 +464,11 @@ class Insert(MultiEventModel, Sequence[Slot], SupportsIndex):
         """Iterator over the effect empty and used slots."""
         for index in range(self._kw["max_slots"] + 1):
             events: list[AnyEvent] = []
-            params: list[_MixerParamsItem] = []
-
-            for param in self._kw["params"]:
-                if param["channel_data"] % 0x3F == index:
-                    params.append(param)
-
             for id, subevents in self._events.items():
                 if (id in SlotID or id in PluginID) and index < len(subevents):
                     events.append(subevents[index])
 
-            yield Slot(*events, params=params)
+            yield Slot(*events, params=self._slot_params.get(index))
 
     def __len__(self):
         if SlotID.Index in self._events:
@@ -495,7 +516,9 @@ class Insert(MultiEventModel, Sequence[Slot], SupportsIndex):
 
         ![](https://bit.ly/3RUCQt6)
         """
-        return InsertEQ(self._kw["params"])
+        if self._eq is None:
+            self._eq = InsertEQ(self._kw["params"])
+        return self._eq
 
     icon = EventProp[int](InsertID.Icon)
     input = EventProp[int](InsertID.Input)
@@ -578,6 +601,8 @@ class Mixer(MultiEventModel, Sequence[Insert]):
     ![](https://bit.ly/3eOsblF)
     """
 
+    __slots__ = ("_inserts",)
+
     _MAX_INSERTS = {
         (1, 6, 5): 5,
         (2, 0, 1): 8,
@@ -592,6 +617,7 @@ class Mixer(MultiEventModel, Sequence[Insert]):
 
     def __init__(self, *events: AnyEvent, **kw: Unpack[_MixerKW]):
         super().__init__(*events, **kw)
+        self._inserts: list[Insert] | None = None
 
     # Inserts don't store their index internally.
     def __getitem__(self, index: SupportsIndex):
@@ -603,46 +629,52 @@ class Mixer(MultiEventModel, Sequence[Insert]):
         Raises:
             ModelNotFound: An :class:`Insert` with :attr:`index` isn't found.
         """
-        for idx, insert in enumerate(self):
-            if idx == index:
-                return insert
+        inserts = self._build()
+        idx = index.__index__()
+        if 0 <= idx < len(inserts):
+            return inserts[idx]
         raise ModelNotFound(index)
 
     def __iter__(self) -> Iterator[Insert]:
-        index = 0
-        events: list[AnyEvent] = []
-        params_dict: DefaultDict[int, list[_MixerParamsItem]] = collections.defaultdict(
-            list
-        )
+        yield from self._build()
 
-        for event in reversed(self._events_tuple):
-            if event.id == MixerID.Params:
-                items = cast(
-                    List[_MixerParamsItem], cast(MixerParamsEvent, event).items
-                )
-
-                for item in items:
-                    params_dict[(item["channel_data"] >> 6) & 0x7F].append(item)
+    def _build(self) -> list[Insert]:
+        """Creates all the inserts once, in a single pass over the events."""
+        if self._inserts is not None:
+            return self._inserts
 
+        insert_events: list[list[AnyEvent]] = []
+        params_events: list[MixerParamsEvent] = []
+        events: list[AnyEvent] = []
         for event in self._events_tuple:
+            if event.id == MixerID.Params:
+                params_events.append(cast(MixerParamsEvent, event))
+
             for enum_ in (InsertID, PluginID, SlotID):
                 if event.id in enum_:
                     events.append(event)
 
             if event.id == InsertID.Output:
-                try:
-                    params_list = params_dict[index]
-                except IndexError:
-                    yield Insert(*events, index=index, max_slots=self.max_slots)
-                else:
-                    yield Insert(
-                        *events,
-                        index=index,
-                        max_slots=self.max_slots,
-                        params=params_list,
-                    )
+                insert_events.append(events)
                 events = []
-                index += 1
+
+        params_dict: DefaultDict[int, list[_MixerParamsItem]] = collections.defaultdict(
+            list
+        )
+        for params_event in reversed(params_events):
+            for item in cast(List[_MixerParamsItem], params_event.items):
+                params_dict[(item["channel_data"] >> 6) & 0x7F].append(item)
+
+        self._inserts = [
+            Insert(
+                *events,
+                index=index,
+                max_slots=self.max_slots,
+                params=params_dict[index],
+            )
+            for index, events in enumerate(insert_events)
+        ]
+        return self._inserts
 
     def __len__(self):
         """Returns the number of inserts present in the project.
@@ -19,7 +19,7 @@ import collections
 import enum
 import sys
 import warnings
-from typing import DefaultDict, cast
+from typing import Any, DefaultDict, cast
 
 if sys.version_info >= (3, 8):
     from typing import SupportsIndex
@@ -33,6 +33,11 @@ else:
 
 import colour
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
 from ._descriptors import EventProp, FlagProp, StructProp
 from ._events import (
     DATA,
@@ -56,6 +61,7 @@ __all__ = ["Note", "Controller", "Pattern", "Patterns"]
 
 
 class _ContollerStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "position": "I",  # 4
         "_u1": 1,  # 5
@@ -67,6 +73,7 @@ class _ContollerStruct(StructBase):
 
 
 class _NoteStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "position": "I",  # 4
         "flags": "H",  # 6
@@ -86,10 +93,12 @@ class _NoteStruct(StructBase):
 
 
 class ControllerEvent(ListEventBase):
+    __slots__ = ()
     STRUCT = _ContollerStruct
 
 
 class NotesEvent(ListEventBase):
+    __slots__ = ()
     STRUCT = _NoteStruct
 
 
@@ -124,6 +133,8 @@ class _NoteFlags(enum.IntFlag):
 
 
 class Note(ItemModel[_NoteStruct]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "Note {} @ {} of length {} for channel #{}".format(
             self.key, self.position, self.length, self.rack_channel
@@ -209,6 +220,7 @@ class Note(ItemModel[_NoteStruct]):
 
 
 class Controller(ItemModel[_ContollerStruct]):
+    __slots__ = ()
     channel = StructProp[int]()
     """Corresponds to the containing channel's `Channel.IID`."""
 
@@ -219,6 +231,8 @@ class Controller(ItemModel[_ContollerStruct]):
 # As of the latest version of FL, note and controller events are stored before
 # all channel events (if they exist). The rest is stored later on as it occurs.
 class Pattern(MultiEventModel, Iterable[Note], SupportsIndex):
+    __slots__ = ()
+
     def __repr__(self):
         num_notes = len(tuple(self))
         return f"Pattern (index={self.index}, name={self.name}, {num_notes} notes)"
@@ -230,7 +244,7 @@ class Pattern(MultiEventModel, Iterable[Note], SupportsIndex):
         """MIDI notes contained inside the pattern."""
         if PatternID.Notes in self._events:
             event = cast(NotesEvent, self._events[PatternID.Notes][0])
-            for item in event.items:
+            for item in event:
                 yield Note(cast(_NoteStruct, item))
 
     color = EventProp[colour.Color](PatternID.Color)
@@ -239,10 +253,99 @@ class Pattern(MultiEventModel, Iterable[Note], SupportsIndex):
     def controllers(self) -> Iterator[Controller]:
         """Parameter automations associated with this pattern (if any)."""
         if PatternID.Controllers in self._events:
-            event = cast(ControllerEvent, self._events[PatternID.Controllers])
-            for item in event.items:
+            event = cast(ControllerEvent, self._events[PatternID.Controllers][0])
+            for item in event:
                 yield Controller(cast(_ContollerStruct, item))
 
+    def controllers_array(self) -> numpy.ndarray:
+        """The controllers as a writable NumPy structured array; requires NumPy.
+
+        Its `position`, `channel` and `value` fields are the properties of
+        :class:`Controller` of the same names. It views the controller data
+        directly, so changes made to it get saved.
+
+        An empty array is returned if the pattern has no controllers.
+
+        Raises:
+            ModuleNotFoundError: When NumPy isn't installed.
+        """
+        if PatternID.Controllers in self._events:
+            return cast(ControllerEvent, self._events[PatternID.Controllers][0]).array
+        dtype = _ContollerStruct.dtype()
+        return numpy.zeros(0, dtype)
+
+    def sample_controllers(
+        self, ppq: int, steps_per_beat: int = 4, length: int | None = None
+    ) -> tuple[numpy.ndarray, dict[int, numpy.ndarray]]:
+        """Samples the controller values of each channel onto a grid of ticks.
+
+        A value holds until the next controller of the same channel, i.e. the
+        value at a tick is the one of the latest controller at or before it.
+
+        Args:
+            ppq (int): :attr:`pyflp.project.Project.ppq` of the project.
+            steps_per_beat (int, 4): Grid points per beat; the i-th one is at
+                tick `i * ppq // steps_per_beat`.
+            length (int, optional): Ticks to sample, from the start of the
+                pattern. Defaults to just past the last controller.
+
+        Raises:
+            ModuleNotFoundError: When NumPy isn't installed.
+            ValueError: When `steps_per_beat` isn't positive or is more
+                than `ppq`.
+
+        Returns:
+            The ticks of the grid and a mapping of a channel's IID to its
+            values at those ticks; NaN before the first controller.
+        """
+        if numpy is None:
+            raise ModuleNotFoundError("NumPy is required for sampling controllers")
+
+        if not 0 < steps_per_beat <= ppq:
+            raise ValueError(f"Can't have {steps_per_beat} steps in {ppq} ticks")
+
+        if PatternID.Controllers in self._events:
+            event = cast(ControllerEvent, self._events[PatternID.Controllers][0])
+            controllers = event._get_array()  # pylint: disable=protected-access
+        else:
+            controllers = numpy.zeros(0, _ContollerStruct.dtype())
+
+        if length is None:
+            length = int(controllers["position"].max()) + 1 if len(controllers) else 0
+        # Positions are rounded down individually, so the grid doesn't drift
+        steps = -(-length * steps_per_beat // ppq)
+        ticks = numpy.arange(steps, dtype=numpy.int64) * ppq // steps_per_beat
+
+        values: dict[int, numpy.ndarray] = {}
+        for channel in numpy.unique(controllers["channel"]).tolist():
+            items = controllers[controllers["channel"] == channel]
+            order = numpy.argsort(items["position"], kind="stable")
+            positions = items["position"][order]
+            indexes = numpy.searchsorted(positions, ticks, side="right") - 1
+            sampled = items["value"][order][numpy.maximum(indexes, 0)]
+            values[channel] = numpy.where(indexes >= 0, sampled, numpy.nan)
+        return ticks, values
+
+    def notes_array(self) -> numpy.ndarray:
+        """The notes as a writable NumPy structured array; requires NumPy.
+
+        Its fields are named like the properties of :class:`Note`; it views
+        the note data directly, so changes made to it get saved. Modifying
+        notes this way is a lot faster than doing it one :class:`Note` at a
+        time, e.g. transposing all the notes an octave up::
+
+            >>> pattern.notes_array()["key"] += 12
+
+        An empty array is returned if the pattern has no notes.
+
+        Raises:
+            ModuleNotFoundError: When NumPy isn't installed.
+        """
+        if PatternID.Notes in self._events:
+            return cast(NotesEvent, self._events[PatternID.Notes][0]).array
+        dtype = _NoteStruct.dtype()
+        return numpy.zeros(0, dtype)
+
     @property
     def index(self) -> int:
         """Internal index of the pattern starting from 1."""
@@ -250,6 +353,12 @@ class Pattern(MultiEventModel, Iterable[Note], SupportsIndex):
 
     @index.setter
     def index(self, value: int):
+        # Keeps the map of Patterns (shared by all the patterns) up to date
+        patterns: dict[int, Pattern] | None = self._kw.get("patterns")
+        if patterns is not None and patterns.get(self.index) is self:
+            del patterns[self.index]
+            patterns[value] = self
+
         for event in self._events[PatternID.New]:
             event.value = value
 
@@ -267,6 +376,13 @@ class Pattern(MultiEventModel, Iterable[Note], SupportsIndex):
 
 
 class Patterns(MultiEventModel, Sequence[Pattern]):
+    __slots__ = ("_index_map", "_patterns")
+
+    def __init__(self, *events: AnyEvent, **kw: Any):
+        super().__init__(*events, **kw)
+        self._index_map: dict[int, Pattern] = {}
+        self._patterns: list[Pattern] | None = None
+
     def __repr__(self):
         indexes = [pattern.__index__() for pattern in self]
         return f"{len(indexes)} Patterns {indexes!r}"
@@ -284,13 +400,29 @@ class Patterns(MultiEventModel, Sequence[Pattern]):
             warnings.warn("Patterns use a 1 based index; try 1 instead", stacklevel=0)
             return NotImplemented
 
-        for pattern in self:
-            if pattern.__index__() == index:
-                return pattern
-        raise ModelNotFound(index)
+        pattern = self._find(index.__index__())
+        if pattern is None:
+            raise ModelNotFound(index)
+        return pattern
+
+    def _find(self, index: int) -> Pattern | None:
+        """Looks up a pattern from a map of patterns by their index."""
+        self._build()
+        return self._index_map.get(index)
 
     def __iter__(self) -> Iterator[Pattern]:
         """An iterator over the patterns found in the project."""
+        yield from self._build()
+
+    def _build(self) -> list[Pattern]:
+        """Creates all the patterns once and maps them by their indexes.
+
+        Every :class:`Pattern` shares the map; a pattern is mapped again when
+        its index is changed.
+        """
+        if self._patterns is not None:
+            return self._patterns
+
         cur_pat_id = 0
         events_dict: DefaultDict[int, list[AnyEvent]] = collections.defaultdict(list)
 
@@ -300,8 +432,15 @@ class Patterns(MultiEventModel, Sequence[Pattern]):
                     cur_pat_id = event.value
                 events_dict[cur_pat_id].append(event)
 
+        index_map: dict[int, Pattern] = {}
+        self._patterns = []
         for events in events_dict.values():
-            yield Pattern(*events)
+            pattern = Pattern(*events, patterns=index_map)
+            index_map[pattern.index] = pattern
+            self._patterns.append(pattern)
+
+        self._index_map = index_map
+        return self._patterns
 
     def __len__(self):
         """Returns the number of patterns found in the project.
@@ -324,6 +463,4 @@ class Patterns(MultiEventModel, Sequence[Pattern]):
         """Returns the currently selected pattern."""
         if PatternsID.CurrentlySelected in self._events:
             index = self._events[PatternsID.CurrentlySelected][0].value
-            for pattern in self:
-                if pattern.index == index:
-                    return pattern
+            return self._find(index)
@@ -60,26 +60,32 @@ __all__ = [
 
 
 class _BooBassStruct(StructBase):
+    __slots__ = ()
     PROPS = dict.fromkeys(("_u1", "bass", "mid", "high"), "I")  # _u1 = [1, 0, 0, 0]
 
 
 class _FruityBalanceStruct(StructBase):
+    __slots__ = ()
     PROPS = {"pan": "I", "volume": "I"}
 
 
 class _FruityFastDistStruct(StructBase):
+    __slots__ = ()
     PROPS = dict.fromkeys(("pre", "threshold", "kind", "mix", "post"), "I")
 
 
 class _FruitySendStruct(StructBase):
+    __slots__ = ()
     PROPS = {"pan": "I", "dry": "I", "volume": "I", "send_to": "i"}
 
 
 class _FruitySoftClipperStruct(StructBase):
+    __slots__ = ()
     PROPS = {"threshold": "I", "post": "I"}
 
 
 class _FruityStereoEnhancerStruct(StructBase):
+    __slots__ = ()
     PROPS = dict.fromkeys(
         (
             "pan",
@@ -94,10 +100,12 @@ class _FruityStereoEnhancerStruct(StructBase):
 
 
 class _SoundgoodizerStruct(StructBase):
+    __slots__ = ()
     PROPS = dict.fromkeys(("_u1", "mode", "amount"), "I")
 
 
 class _WrapperStruct(StructBase):
+    __slots__ = ()
     PROPS = {
         "_u16": 16,  # 16
         "flags": "H",  # 18
@@ -106,18 +114,23 @@ class _WrapperStruct(StructBase):
 
 
 class BooBassEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _BooBassStruct
 
 
 class FruityBalanceEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _FruityBalanceStruct
 
 
 class FruityFastDistEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _FruityFastDistStruct
 
 
 class FruityNotebook2Event(DataEventBase):
+    __slots__ = ("_props",)
+
     def __init__(self, id: int, data: bytes) -> None:
         super().__init__(id, data)
         self._props: dict[str, Any] = {}
@@ -142,22 +155,27 @@ class FruityNotebook2Event(DataEventBase):
 
 
 class FruitySendEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _FruitySendStruct
 
 
 class FruitySoftClipperEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _FruitySoftClipperStruct
 
 
 class FruityStereoEnhancerEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _FruityStereoEnhancerStruct
 
 
 class SoundgoodizerEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _SoundgoodizerStruct
 
 
 class WrapperEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _WrapperStruct
 
 
@@ -200,6 +218,7 @@ class _WrapperFlags(enum.IntFlag):
 
 
 class VSTPluginEvent(DataEventBase):
+    __slots__ = ("_events", "_props")
     VST_MARKERS = (8, 10)
 
     def __init__(self, id: int, data: bytes) -> None:
@@ -232,18 +251,26 @@ class VSTPluginEvent(DataEventBase):
 
     def __setitem__(self, prop: str, value: Any):
         self._props[prop] = value
+        self._changed()
 
     def __bytes__(self) -> bytes:
-        self._stream.seek(0)
+        if self._props["kind"] not in VSTPluginEvent.VST_MARKERS:
+            return super().__bytes__()  # The data isn't made of sub-events
+
+        self._stream.seek(4)  # Skip the kind marker
         for event in self._events:
             try:
-                key = getattr(_VSTPluginEventID(event.id), "key")
+                key = getattr(_VSTPluginEventID(event.id), "key") or event.id
             except ValueError:
                 key = event.id
             event.value = self._props[key]
             self._stream.write(bytes(event))
+        self._stream.truncate()
         return super().__bytes__()
 
+    def _sizeof(self):
+        return len(bytes(self))  # sub-events are only serialised when needed
+
 
 @enum.unique
 class PluginID(EventEnum):
@@ -262,6 +289,7 @@ class PluginID(EventEnum):
 
 @runtime_checkable
 class _IPlugin(Protocol):
+    __slots__ = ()
     INTERNAL_NAME: ClassVar[str]
     """The name used internally by FL to decide the type of plugin data."""
 
@@ -275,6 +303,8 @@ class _WrapperProp(FlagProp):
 
 
 class _PluginBase(MultiEventModel, Generic[_PE_co]):
+    __slots__ = ()
+
     def __init__(self, *events: WrapperEvent | _PE_co, **kw: Any):
         super().__init__(*events, **kw)
 
@@ -347,6 +377,7 @@ class _PluginDataProp(StructProp[T]):
 
 
 class PluginIOInfo(SingleEventModel):
+    __slots__ = ()
     mixer_offset = StructProp[int]()
     flags = StructProp[int]()
 
@@ -358,6 +389,8 @@ class VSTPlugin(_PluginBase[VSTPluginEvent], _IPlugin):
     *New in FL Studio v9.0.3*: VST3 support.
     """
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Wrapper"
     fourcc = _PluginDataProp[str]()
     """A unique four character code identifying the plugin.
@@ -399,6 +432,8 @@ class VSTPlugin(_PluginBase[VSTPluginEvent], _IPlugin):
 class BooBass(_PluginBase[BooBassEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3Bk3aGK)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "BooBass"
     bass = _PluginDataProp[int]()
     """Volume of the bass region.
@@ -428,6 +463,8 @@ class BooBass(_PluginBase[BooBassEvent], _IPlugin, ModelReprMixin):
 class FruityBalance(_PluginBase[FruityBalanceEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3RWItqU)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Balance"
     pan = _PluginDataProp[int]()
     """Linear.
@@ -461,6 +498,8 @@ class FruityFastDistKind(enum.IntEnum):
 class FruityFastDist(_PluginBase[FruityFastDistEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3qT6Jil)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Fast Dist"
     kind = _PluginDataProp[FruityFastDistKind]()
     mix = _PluginDataProp[int]()
@@ -504,6 +543,8 @@ class FruityFastDist(_PluginBase[FruityFastDistEvent], _IPlugin, ModelReprMixin)
 class FruityNotebook2(_PluginBase[FruityNotebook2Event], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3RHa4g5)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity NoteBook 2"
     active_page = _PluginDataProp[int]()
     """Active page number of the notebook. Min: 0, Max: 100."""
@@ -521,6 +562,8 @@ class FruityNotebook2(_PluginBase[FruityNotebook2Event], _IPlugin, ModelReprMixi
 class FruitySend(_PluginBase[FruitySendEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3DqjvMu)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Send"
     dry = _PluginDataProp[int]()
     """Linear. Defaults to maximum value.
@@ -558,6 +601,8 @@ class FruitySend(_PluginBase[FruitySendEvent], _IPlugin, ModelReprMixin):
 class FruitySoftClipper(_PluginBase[FruitySoftClipperEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3BCWfJX)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Soft Clipper"
     post = _PluginDataProp[int]()
     """Linear.
@@ -602,6 +647,8 @@ class FruityStereoEnhancer(
 ):
     """![](https://bit.ly/3DoHvji)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Fruity Stereo Enhancer"
     effect_position = _PluginDataProp[StereoEnhancerEffectPosition]()
     """Defaults to :attr:`StereoEnhancerEffectPosition.Post`."""
@@ -663,6 +710,8 @@ class SoundgoodizerMode(enum.IntEnum):
 class Soundgoodizer(_PluginBase[SoundgoodizerEvent], _IPlugin, ModelReprMixin):
     """![](https://bit.ly/3dip70y)"""  # noqa
 
+    __slots__ = ()
+
     INTERNAL_NAME = "Soundgoodizer"
     amount = _PluginDataProp[int]()
     """Logarithmic.
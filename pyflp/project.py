@@ -15,12 +15,13 @@
 
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import enum
 import math
 import pathlib
 import sys
-from typing import cast
+from typing import Any, NamedTuple, Sequence, TypeVar, cast
 
 if sys.version_info >= (3, 8):
     from typing import Final, TypedDict
@@ -42,6 +43,7 @@ from ._events import (
     AsciiEvent,
     BoolEvent,
     EventEnum,
+    EventTable,
     I16Event,
     I32Event,
     StructBase,
@@ -63,18 +65,110 @@ from .mixer import InsertID, Mixer, MixerID, SlotID
 from .pattern import PatternID, Patterns, PatternsID
 from .plugin import PluginID
 
+MMT = TypeVar("MMT", bound=MultiEventModel)
+
 _DELPHI_EPOCH: Final = datetime.datetime(1899, 12, 30)
 MIN_TEMPO: Final = 10.000
 VALID_PPQS: Final = (24, 48, 72, 96, 120, 144, 168, 192, 384, 768, 960)
 
-__all__ = ["PanLaw", "Project", "FileFormat", "VALID_PPQS"]
+__all__ = ["PanLaw", "Project", "ProjectInfo", "FileFormat", "VALID_PPQS"]
+
+
+_SUBSYSTEMS: Final = {
+    "arrangements": (ArrangementID, ArrangementsID, TimeMarkerID, TrackID),
+    "channels": (ChannelID, DisplayGroupID, RackID),
+    "mixer": (InsertID, MixerID, SlotID),
+    "patterns": (PatternID, PatternsID),
+    "plugins": (PluginID,),
+}
+"""Event IDs grouped by the part of a project they are used by."""
+
+# Kinds of events, by the models of a project they are used by.
+_RACK, _PLUGIN, _MIXER, _PATTERNS, _ARRANGEMENTS, _TIMEMARKER = range(1, 7)
+_KINDS: Final = {
+    "channels": _RACK,
+    "plugins": _PLUGIN,
+    "mixer": _MIXER,
+    "patterns": _PATTERNS,
+    "arrangements": _ARRANGEMENTS,
+}
+"""Kinds of the events of each of `_SUBSYSTEMS`, in the order they're matched."""
+
+
+def _event_kind(id: int) -> int:
+    for name, kind in _KINDS.items():
+        for enum_ in _SUBSYSTEMS[name]:
+            if id in enum_:
+                # Time markers are found in patterns too
+                return _TIMEMARKER if enum_ is TimeMarkerID else kind
+    return 0
+
+
+_EVENT_KINDS: Final = bytes(_event_kind(id) for id in range(256))
+
+
+class _Sections(NamedTuple):
+    """Positions of the events used by each of the models of a project."""
+
+    channels: list[int]
+    mixer: list[int]
+    patterns: list[int]
+    arrangements: list[int]
+
+
+def _index_sections(ids: Sequence[int]) -> _Sections:
+    """Finds the events used by each of the models of a project in one pass."""
+    sections = _Sections([], [], [], [])
+    channels, mixer, patterns, arrangements = sections
+    insert_flags, arrangement_new = int(InsertID.Flags), int(ArrangementID.New)
+    window_height = int(RackID.WindowHeight)
+    window_height_pos = None
+    rack_ended = inserts_began = arrnew_occured = False
+
+    for pos, id in enumerate(ids):
+        kind = _EVENT_KINDS[id]
+        if not kind:
+            continue
+
+        if kind == _MIXER:
+            # TODO Find a more reliable to detect when inserts start.
+            inserts_began = True
+            rack_ended = rack_ended or id == insert_flags
+            mixer.append(pos)
+        elif kind == _PLUGIN:
+            if not rack_ended:
+                channels.append(pos)
+            if inserts_began:
+                mixer.append(pos)
+        elif kind == _RACK:
+            if window_height_pos is None and id == window_height:
+                window_height_pos = pos
+            if not rack_ended:
+                channels.append(pos)
+        elif kind == _PATTERNS:
+            patterns.append(pos)
+        elif kind == _ARRANGEMENTS:
+            arrnew_occured = arrnew_occured or id == arrangement_new
+            arrangements.append(pos)
+
+        # * Prevents accidentally passing on Pattern's timemarkers
+        # TODO This logic will still be incorrect if arrangement's
+        # timemarkers occur before ArrangementID.New event.
+        elif arrnew_occured:
+            arrangements.append(pos)
+
+    if window_height_pos is not None:
+        channels.insert(0, window_height_pos)
+    return sections
 
 
 class _TimestampStruct(StructBase):
+    __slots__ = ()
     PROPS = {"created_on": "d", "time_spent": "d"}
 
 
 class TimestampEvent(StructEventBase):
+    __slots__ = ()
     STRUCT = _TimestampStruct
 
 
@@ -147,6 +241,87 @@ class ProjectID(EventEnum):
     Timestamp = (DATA + 29, TimestampEvent)
 
 
+_TEMPO_IDS: Final = (ProjectID.Tempo, ProjectID._TempoCoarse, ProjectID._TempoFine)
+
+
+def _decode_version(value: str) -> FLVersion:
+    return FLVersion(*tuple(int(part) for part in value.split(".")))
+
+
+def _decode_tempo(values: dict[int, Any]) -> int | float | None:
+    """Tempo in BPM, from a dict of the `_TEMPO_IDS` found to event values."""
+    if ProjectID.Tempo in values:
+        return values[ProjectID.Tempo] / 1000
+
+    tempo = values.get(ProjectID._TempoCoarse)
+    if tempo is not None and ProjectID._TempoFine in values:
+        tempo += values[ProjectID._TempoFine] / 1000
+    return tempo
+
+
+def _decode_created_on(event: TimestampEvent) -> datetime.datetime:
+    return _DELPHI_EPOCH + datetime.timedelta(days=event["created_on"])
+
+
+def _decode_time_spent(event: TimestampEvent) -> datetime.timedelta:
+    return datetime.timedelta(days=event["time_spent"])
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectInfo:
+    """Header fields and metadata of a project, as returned by `pyflp.probe`.
+
+    Metadata not found in the file is `None`. The meaning of each field is
+    the same as that of the :class:`Project` property of the same name.
+    """
+
+    format: FileFormat
+    channel_count: int
+    ppq: int
+    version: FLVersion | None = None
+    build: int | None = None
+    """The value of :attr:`ProjectID.FLBuild`."""
+
+    title: str | None = None
+    artists: str | None = None
+    genre: str | None = None
+    tempo: int | float | None = None
+    created_on: datetime.datetime | None = None
+    time_spent: datetime.timedelta | None = None
+
+    @classmethod
+    def from_values(
+        cls, values: dict[int, Any], format: FileFormat, channel_count: int, ppq: int
+    ):
+        """Creates an instance from a dict of :class:`ProjectID` to event values.
+
+        The value for :attr:`ProjectID.Timestamp` is the event itself.
+        """
+        version = None
+        if ProjectID.FLVersion in values:
+            version = _decode_version(values[ProjectID.FLVersion])
+
+        created_on = time_spent = None
+        if ProjectID.Timestamp in values:
+            event = cast(TimestampEvent, values[ProjectID.Timestamp])
+            created_on = _decode_created_on(event)
+            time_spent = _decode_time_spent(event)
+
+        return cls(
+            format,
+            channel_count,
+            ppq,
+            version=version,
+            build=values.get(ProjectID.FLBuild),
+            title=values.get(ProjectID.Title),
+            artists=values.get(ProjectID.Artists),
+            genre=values.get(ProjectID.Genre),
+            tempo=_decode_tempo(values),
+            created_on=created_on,
+            time_spent=time_spent,
+        )
+
+
 class _ProjectKW(TypedDict):
     channel_count: int
     ppq: int
@@ -154,40 +329,45 @@ class _ProjectKW(TypedDict):
 
 
 class Project(MultiEventModel):
-    """Represents an FL Studio project."""
+    """Represents an FL Studio project.
+
+    Events can be passed either as is or in an :class:`EventTable`, in which
+    case they get created only when a property actually needs them.
+    """
 
-    def __init__(self, *events: AnyEvent, **kw: Unpack[_ProjectKW]):
+    __slots__ = ("_sections", "_indexed", "_views")
+
+    def __init__(self, *events: AnyEvent | EventTable, **kw: Unpack[_ProjectKW]):
         super().__init__(*events, **kw)
+        self._sections: _Sections | None = None
+        self._indexed = 0  # Number of events when `_sections` was built
+        self._views: dict[str, MultiEventModel] = {}
 
     def __repr__(self) -> str:
         return f"FL Studio {str(self.version)} {self.format.name}"
 
-    def _collect_events(self, *enums: type[EventEnum]):
-        for event in self._events_tuple:
-            for enum_ in enums:
-                if event.id in enum_:
-                    yield event
-                    break
+    def _view(self, cls: type[MMT], section: str, **kw: Any) -> MMT:
+        """Returns the model of the events of `section`, creating it once.
+
+        Models (and the models they create) are reused until the events of
+        the project or the keyword arguments the model needs are changed.
+        """
+        events = self._events_tuple
+        if self._sections is None or self._indexed != len(events):
+            self._sections = _index_sections(self._event_ids())
+            self._indexed = len(events)
+            self._views.clear()
+
+        view = self._views.get(section)
+        if view is None or view._kw != kw:
+            positions = getattr(self._sections, section)
+            view = self._views[section] = cls(*(events[pos] for pos in positions), **kw)
+        return cast(MMT, view)
 
     @property
     def arrangements(self) -> Arrangements:
         """Provides an iterator over arrangements and other related properties."""
-        arrnew_occured = False
-        filtered_events: list[AnyEvent] = []
-        for event in self._collect_events(
-            ArrangementID, ArrangementsID, TrackID, TimeMarkerID
-        ):
-            if event.id == ArrangementID.New:
-                arrnew_occured = True
-
-            # * Prevents accidentally passing on Pattern's timemarkers
-            # TODO This logic will still be incorrect if arrangement's
-            # timemarkers occur before ArrangementID.New event.
-            elif event.id in TimeMarkerID and not arrnew_occured:
-                continue
-            filtered_events.append(event)
-
-        return Arrangements(*filtered_events, version=self.version)
+        return self._view(Arrangements, "arrangements", version=self.version)
 
     artists = EventProp[str](ProjectID.Artists)
     """Authors / artists info. to be embedded in exported WAV & MP3.
@@ -215,21 +395,7 @@ class Project(MultiEventModel):
     @property
     def channels(self) -> ChannelRack:
         """Provides an iterator over channels and channel rack properties."""
-        events: list[AnyEvent] = []
-
-        if RackID.WindowHeight in self._events:
-            events.append(self._events[RackID.WindowHeight][0])
-
-        for event in self._events_tuple:
-            if event.id == InsertID.Flags:
-                break
-
-            for enum_ in (ChannelID, DisplayGroupID, PluginID, RackID):
-                if event.id in enum_:
-                    events.append(event)
-                    break
-
-        return ChannelRack(*events, channel_count=self.channel_count)
+        return self._view(ChannelRack, "channels", channel_count=self.channel_count)
 
     comments = EventProp[str](ProjectID.Comments, ProjectID._RTFComments)
     """Comments / project description / summary.
@@ -246,7 +412,7 @@ class Project(MultiEventModel):
         """The local date and time on which this project was created."""
         if ProjectID.Timestamp in self._events:
             event = cast(TimestampEvent, self._events[ProjectID.Timestamp][0])
-            return _DELPHI_EPOCH + datetime.timedelta(days=event["created_on"])
+            return _decode_created_on(event)
 
     format = KWProp[FileFormat]()
     """Internal format marker used by FL Studio to distinguish between types."""
@@ -341,26 +507,12 @@ class Project(MultiEventModel):
     @property
     def mixer(self) -> Mixer:
         """Provides an iterator over inserts and other mixer related properties."""
-        events: list[AnyEvent] = []
-        inserts_began = False
-        for event in self._events_tuple:
-            # * Cannot use self._collect_events to first gather these and add
-            # * PluginID events later; as it breaks the order of occurence.
-            for enum_ in (MixerID, InsertID, SlotID):
-                if event.id in enum_:
-                    # TODO Find a more reliable to detect when inserts start.
-                    inserts_began = True
-                    events.append(event)
-
-            if event.id in PluginID and inserts_began:
-                events.append(event)
-
-        return Mixer(*events, version=self.version)
+        return self._view(Mixer, "mixer", version=self.version)
 
     @property
     def patterns(self) -> Patterns:
         """Provides an iterator over patterns and other related properties."""
-        return Patterns(*self._collect_events(PatternsID, PatternID))
+        return self._view(Patterns, "patterns")
 
     pan_law = EventProp[PanLaw](ProjectID.PanLaw)
     """Whether a circular or a triangular pan law is used for the project."""
@@ -419,15 +571,9 @@ class Project(MultiEventModel):
         * *New in FL Studio v3.4.0*: Fine tuned tempo (a float).
         * *Changed in FL Studio v11*: Max tempo limited to 522.000.
         """
-        if ProjectID.Tempo in self._events:
-            return self._events[ProjectID.Tempo][0].value / 1000
-
-        tempo = None
-        if ProjectID._TempoCoarse in self._events:
-            tempo = self._events[ProjectID._TempoCoarse][0].value
-        if ProjectID._TempoFine in self._events:
-            tempo += self._events[ProjectID._TempoFine][0].value / 1000
-        return tempo
+        return _decode_tempo(
+            {id: self._events[id][0].value for id in _TEMPO_IDS if id in self._events}
+        )
 
     @tempo.setter
     def tempo(self, value: int | float):
@@ -466,7 +612,7 @@ class Project(MultiEventModel):
         """
         if ProjectID.Timestamp in self._events:
             event = cast(TimestampEvent, self._events[ProjectID.Timestamp][0])
-            return datetime.timedelta(days=event["time_spent"])
+            return _decode_time_spent(event)
 
     url = EventProp[str](ProjectID.Url)
 
@@ -492,7 +638,7 @@ class Project(MultiEventModel):
         """
         events = self._events[ProjectID.FLVersion]
         event = cast(AsciiEvent, events[0])
-        return FLVersion(*tuple(int(part) for part in event.value.split(".")))
+        return _decode_version(event.value)
 
     @version.setter
     def version(self, value: FLVersion | str | tuple[int, ...]):
@@ -7,8 +7,19 @@ from pyflp.mixer import Mixer
 
 
 @pytest.fixture(scope="session")
-def project():
-    return parse(pathlib.Path(__file__).parent / "assets" / "FL 20.8.4.flp")
+def asset():
+    return pathlib.Path(__file__).parent / "assets" / "FL 20.8.4.flp"
+
+
+@pytest.fixture(scope="session")
+def project(asset: pathlib.Path):
+    return parse(asset)
+
+
+@pytest.fixture
+def fresh_project(asset: pathlib.Path):
+    """Parsed again for every test, so that it can be changed freely."""
+    return parse(asset)
 
 
 @pytest.fixture(scope="session")
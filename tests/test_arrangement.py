@@ -98,6 +98,13 @@ def test_track_items(tracks: tuple[Track, ...]):
         assert [i.group for i in track.items] == [0] * num_items
 
 
+def test_track_items_cached(arrangements: Arrangements):
+    arrangement = arrangements[0]
+    first = [item for track in arrangement.tracks for item in track]
+    second = [item for track in arrangement.tracks for item in track]
+    assert first and all(a is b for a, b in zip(first, second))
+
+
 def test_track_locked(tracks: tuple[Track, ...]):
     for track in tracks:
         assert track.locked if track.name == "Locked" else not track.locked
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+
+import pyflp
+from pyflp.cache import ParseCache
+from pyflp.project import Project
+
+
+def test_parse_cache(tmp_path: pathlib.Path, asset: pathlib.Path, project: Project):
+    path = tmp_path / "project.flp"
+    shutil.copy(asset, path)
+    cache = ParseCache(tmp_path / "cache")
+
+    pyflp.parse(path, cache=cache)
+    assert len(list(cache.directory.iterdir())) == 1
+    cached = pyflp.parse(path, cache=cache)
+    assert cached.events_astuple() == project.events_astuple()
+    assert cached.format == project.format
+    assert cached.ppq == project.ppq
+
+    # Same path, size and modification time, but different contents
+    stat = os.stat(path)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(data)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    changed = pyflp.parse(path, cache=cache)
+    assert changed.events_astuple() != project.events_astuple()
+    assert changed.events_astuple() == pyflp.parse(path).events_astuple()
+
+
+def test_parse_cache_include(
+    tmp_path: pathlib.Path, asset: pathlib.Path, project: Project
+):
+    cache = ParseCache(tmp_path / "cache")
+    pyflp.parse(asset, include=(), cache=cache)
+    full = pyflp.parse(asset, cache=cache)
+    assert [type(e) for e in full.events_astuple()] == [
+        type(e) for e in project.events_astuple()
+    ]
+    assert [len(tuple(p)) for p in full.patterns] == [
+        len(tuple(p)) for p in project.patterns
+    ]
+
+    pyflp.parse(asset, include=("patterns", "mixer"), cache=cache)
+    pyflp.parse(asset, include=("mixer", "patterns", "mixer"), cache=cache)
+    assert len(list(cache.directory.iterdir())) == 3
+
+
+def test_parse_cache_eviction(tmp_path: pathlib.Path, asset: pathlib.Path):
+    cache = ParseCache(tmp_path / "cache", max_size=0)
+    pyflp.parse(asset, lazy=True, cache=cache)
+    assert not list(cache.directory.iterdir())
@@ -5,7 +5,8 @@ import pathlib
 import colour
 import pytest
 
-from pyflp.channel import Channel, ChannelRack, Layer, Sampler
+from pyflp.channel import Channel, ChannelNotFound, ChannelRack, Layer, Sampler
+from pyflp.project import Project
 
 
 def test_channels(rack: ChannelRack):
@@ -94,3 +95,34 @@ def test_sampler_path(samplers: tuple[Sampler, ...]):
             # fmt: on
         else:
             assert not sampler.sample_path
+
+
+def test_rack_lookup(rack: ChannelRack):
+    channels = tuple(rack)
+    assert rack[2] is channels[2]
+    assert rack["17"] is channels[17]
+    with pytest.raises(ChannelNotFound):
+        rack[len(channels)]
+    with pytest.raises(ChannelNotFound):
+        rack["100"]
+    assert rack[2] is channels[2]  # A miss doesn't create the channels again
+
+
+def test_rack_lookup_changed_iid(fresh_project: Project):
+    rack = fresh_project.channels
+    channel = rack["17"]
+    channel.iid = 100
+    assert rack["100"] is channel
+    with pytest.raises(ChannelNotFound):
+        rack["17"]
+    assert rack["100"] is channel and rack[17] is channel
+
+
+def test_layer_children(project: Project):
+    layer = next(project.channels.layers)  # Children are found after the layer
+    assert [child.iid for child in layer] == [0, 1, *range(3, 18)]
+    assert layer[2].iid == 3
+    assert layer["3"] is layer[2] and layer[16] is layer["16"]  # IID comes first
+    assert layer[0] is project.channels["0"]
+    with pytest.raises(ChannelNotFound):
+        layer["2"]
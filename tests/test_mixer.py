@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import colour
+import pytest
 
+from pyflp.exceptions import ModelNotFound
 from pyflp.mixer import Insert, InsertDock, Mixer
+from pyflp.project import Project
 
 
 def test_mixer(mixer: Mixer):
@@ -12,6 +15,15 @@ def test_mixer(mixer: Mixer):
     assert mixer.max_slots == 10
 
 
+def test_mixer_lookup(mixer: Mixer):
+    inserts = tuple(mixer)
+    assert mixer[0] is inserts[0]
+    assert mixer[126] is inserts[126]
+    assert mixer[5].__index__() == 5
+    with pytest.raises(ModelNotFound):
+        mixer[127]
+
+
 def test_insert_bypassed(inserts: tuple[Insert]):
     for insert in inserts:
         assert insert.bypassed if insert.name == "Bypassed" else not insert.bypassed
@@ -98,3 +110,14 @@ def test_insert_name(inserts: tuple[Insert]):
         "Post EQ",
         "50ms input latency",
     ]
+
+
+def test_slot_params(fresh_project: Project):
+    insert = fresh_project.mixer[1]
+    slots = tuple(insert)
+    assert slots[3].enabled and slots[3].mix == 12800
+    assert slots[0].mix is None
+
+    slots[3].mix = 6400
+    assert insert[3].mix == 6400
+    assert insert.eq.sizeof() == 456
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import pathlib
+import struct
 from itertools import chain
 
 import pytest
 
-from pyflp.pattern import Note, Patterns
+import pyflp
+from pyflp.exceptions import ModelNotFound
+from pyflp.pattern import ControllerEvent, Note, Pattern, PatternID, Patterns
+from pyflp.project import Project
 
 
 def test_patterns(patterns: Patterns):
@@ -13,6 +18,18 @@ def test_patterns(patterns: Patterns):
     assert patterns.play_cut_notes
 
 
+def test_patterns_lookup(fresh_project: Project):
+    patterns = fresh_project.patterns
+    assert patterns[2] is patterns[2]
+
+    colored = patterns[2]
+    colored.index = 9
+    assert patterns[9] is colored
+    with pytest.raises(ModelNotFound):
+        patterns[2]
+    assert any(p is colored for p in patterns)  # A miss doesn't create them again
+
+
 def test_names(patterns: Patterns):
     assert set(pattern.name for pattern in patterns) == set(
         ("Default", "Colored", "MIDI", "Timemarkers", "Selected")
@@ -86,3 +103,105 @@ def test_notes(patterns: Patterns):
         if pattern.index == 3:
             assert len(notes) == 48
             assert set(n.key for n in notes) == set([60])
+
+
+def test_note_set(tmp_path: pathlib.Path, fresh_project: Project):
+    notes = tuple(fresh_project.patterns[3])
+    velocities = [n.velocity for n in notes]
+    notes[1].velocity = velocities[1] = 1
+    assert [n.velocity for n in notes] == velocities
+
+    pyflp.save(fresh_project, tmp_path / "saved.flp")
+    saved = pyflp.parse(tmp_path / "saved.flp")
+    assert [n.velocity for n in saved.patterns[3]] == velocities
+
+
+def test_notes_array(tmp_path: pathlib.Path, fresh_project: Project):
+    numpy = pytest.importorskip("numpy")
+    notes = fresh_project.patterns[3].notes_array()
+    assert notes["velocity"].tolist() == [n.velocity for n in fresh_project.patterns[3]]
+    assert notes["key"].tolist() == [n.key for n in fresh_project.patterns[3]]
+
+    notes["key"] += 12
+    notes["velocity"] = numpy.arange(len(notes)) % 128
+    pyflp.save(fresh_project, tmp_path / "saved.flp")
+    saved = pyflp.parse(tmp_path / "saved.flp")
+    assert [n.key for n in saved.patterns[3]] == notes["key"].tolist()
+    assert [n.velocity for n in saved.patterns[3]] == notes["velocity"].tolist()
+
+
+def test_notes_event_without_numpy(
+    monkeypatch: pytest.MonkeyPatch, asset: pathlib.Path, notes: tuple[Note, ...]
+):
+    monkeypatch.setattr("pyflp._events.numpy", None)
+    project = pyflp.parse(asset)
+    assert [n.key for n in project.patterns[3]] == [n.key for n in notes]
+    with pytest.raises(ModuleNotFoundError):
+        project.patterns[3].events_asdict()[PatternID.Notes][0].array
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_notes_event_slice(
+    monkeypatch: pytest.MonkeyPatch, asset: pathlib.Path, with_numpy: bool
+):
+    if not with_numpy:
+        monkeypatch.setattr("pyflp._events.numpy", None)
+    project = pyflp.parse(asset, lazy=True)
+    event = project.patterns[3].events_asdict()[PatternID.Notes][0]
+    last, first = event[-1]["key"], [item["key"] for item in event[0:3]]
+    keys = [item["key"] for item in event]
+    assert (last, first) == (keys[-1], keys[0:3])
+    assert [item["key"] for item in event[::-2]] == keys[::-2]
+
+    # Both backends behave the same as the items used to
+    assert {len(item) for item in event} == {event._stream_len}
+    items = event.items
+    assert items is event.items and items[-1] is event[-1]
+
+
+@pytest.fixture
+def controllers_pattern():
+    def controller(position: int, channel: int, value: float):
+        return struct.pack("<I2xBxf", position, channel, value)
+
+    data = b"".join(
+        (
+            controller(0, 1, 0.5),
+            controller(48, 2, 0.25),
+            controller(96, 1, 1.0),
+        )
+    )
+    return Pattern(ControllerEvent(PatternID.Controllers, data))
+
+
+def test_pattern_controllers(controllers_pattern: Pattern):
+    controllers = list(controllers_pattern.controllers)
+    assert [c.position for c in controllers] == [0, 48, 96]
+    assert [c.channel for c in controllers] == [1, 2, 1]
+    assert [c.value for c in controllers] == [0.5, 0.25, 1.0]
+
+
+def test_pattern_sample_controllers(controllers_pattern: Pattern):
+    numpy = pytest.importorskip("numpy")
+    array = controllers_pattern.controllers_array()
+    assert array["position"].tolist() == [0, 48, 96]
+
+    ticks, values = controllers_pattern.sample_controllers(96, steps_per_beat=4)
+    assert ticks.tolist() == [0, 24, 48, 72, 96]
+    assert values[1].tolist() == [0.5, 0.5, 0.5, 0.5, 1.0]
+    assert numpy.isnan(values[2][:2]).all()
+    assert values[2][2:].tolist() == [0.25] * 3
+
+    # 96 isn't divisible by 5 steps, so the positions are rounded down
+    ticks, _ = controllers_pattern.sample_controllers(96, 5, length=193)
+    assert ticks.tolist() == [0, 19, 38, 57, 76, 96, 115, 134, 153, 172, 192]
+    for steps_per_beat in (0, -1, 97):
+        with pytest.raises(ValueError):
+            controllers_pattern.sample_controllers(96, steps_per_beat)
+
+
+def test_pattern_sample_controllers_without_numpy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("pyflp._events.numpy", None)
+    monkeypatch.setattr("pyflp.pattern.numpy", None)
+    with pytest.raises(ModuleNotFoundError):
+        Pattern().sample_controllers(96)
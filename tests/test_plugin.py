@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+import struct
 from typing import cast
 
 import pytest
@@ -13,11 +15,13 @@ from pyflp.plugin import (
     FruitySend,
     FruitySoftClipper,
     FruityStereoEnhancer,
+    PluginID,
     Soundgoodizer,
     SoundgoodizerMode,
     StereoEnhancerEffectPosition,
     StereoEnhancerPhaseInversion,
     VSTPlugin,
+    VSTPluginEvent,
 )
 
 
@@ -91,3 +95,11 @@ def test_vst_plugin(plugins: tuple[AnyPlugin, ...]):
 
     with pytest.raises(KeyError):
         ott.fourcc
+
+
+def test_vst_plugin_event_other_kind():
+    data = struct.pack("<I", 5) + b"opaque-state-bytes"
+    event = VSTPluginEvent(PluginID.Data, data)
+    assert bytes(event)[2:] == data
+    assert len(event) == 2 + len(data)
+    assert pickle.loads(pickle.dumps(event)) == event
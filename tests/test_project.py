@@ -1,10 +1,30 @@
 from __future__ import annotations
 
 import datetime
+import io
+import os
 import pathlib
+import pickle
+import stat
 import textwrap
 
-from pyflp.project import FileFormat, FLVersion, PanLaw, Project
+import pytest
+
+import pyflp
+from pyflp.arrangement import ArrangementID, TimeMarkerID
+from pyflp.channel import ChannelID
+from pyflp.mixer import InsertID, MixerID
+from pyflp.pattern import PatternID
+from pyflp.plugin import PluginID
+from pyflp.project import (
+    FileFormat,
+    FLVersion,
+    PanLaw,
+    Project,
+    ProjectID,
+    ProjectInfo,
+    _index_sections,
+)
 
 
 def test_project(project: Project):
@@ -42,3 +62,225 @@ def test_project(project: Project):
     assert project.title == "PyFLP Test FLP"
     assert project.url == "https://github.com/demberto/PyFLP"
     assert project.version == FLVersion(20, 8, 4, 2576)
+
+
+def test_parse_mmap(asset: pathlib.Path, project: Project):
+    mapped = pyflp.parse(asset, mmap=True)
+    assert mapped.events_astuple() == project.events_astuple()
+    assert mapped.title == project.title
+    assert [ch.name for ch in mapped.channels] == [ch.name for ch in project.channels]
+
+
+def test_parse_lazy(asset: pathlib.Path, project: Project):
+    lazy = pyflp.parse(asset, lazy=True)
+    assert lazy.tempo == project.tempo
+    assert lazy.title == project.title
+    table = lazy._events_tuple
+    assert sum(event is not None for event in table._events) < 5
+    assert [ch.name for ch in lazy.channels] == [ch.name for ch in project.channels]
+    assert lazy.events_astuple() == project.events_astuple()
+
+
+def test_event_table_index(asset: pathlib.Path, project: Project):
+    table = pyflp.parse(asset, lazy=True)._events_tuple
+    events = project.events_astuple()
+    assert table[-len(table)] == events[0]
+    assert table[-1] == events[-1]
+    assert table[1:3] == list(events[1:3])
+    with pytest.raises(IndexError):
+        table[len(table)]
+    with pytest.raises(IndexError):
+        table[-len(table) - 1]
+
+
+def test_iter_events(asset: pathlib.Path, project: Project):
+    assert tuple(pyflp.iter_events(asset)) == project.events_astuple()
+
+    with open(asset, "rb") as flp:
+        raw = list(pyflp.iter_events(flp, raw=True))
+    assert [id for id, _ in raw] == [event.id for event in project.events_astuple()]
+
+
+def test_probe(asset: pathlib.Path, project: Project):
+    info = pyflp.probe(asset)
+    assert info.format == project.format
+    assert info.channel_count == project.channel_count
+    assert info.ppq == project.ppq
+    assert info.version == project.version
+    assert info.build == 2576
+    assert info.title == project.title
+    assert info.artists == project.artists
+    assert info.genre == project.genre
+    assert info.tempo == project.tempo
+    assert info.created_on == project.created_on
+    assert info.time_spent == project.time_spent
+
+    # Stops after the last of the events saved by modern versions of FL
+    table = pyflp.parse(asset, lazy=True)._events_tuple
+    last = max(table.ids.index(id) for id in pyflp._PROBED_IDS)
+    with open(asset, "rb") as flp:
+        pyflp.probe(flp)
+        assert flp.tell() == table._offsets[last] + table._sizes[last]
+
+    legacy = {ProjectID._TempoCoarse: 120, ProjectID._TempoFine: 500}
+    assert ProjectInfo.from_values(legacy, FileFormat.Project, 1, 96).tempo == 120.5
+
+
+def test_save_roundtrip(tmp_path: pathlib.Path, asset: pathlib.Path):
+    pyflp.save(pyflp.parse(asset), str(tmp_path / "saved.flp"))
+    assert (tmp_path / "saved.flp").read_bytes() == asset.read_bytes()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_save_permissions(
+    tmp_path: pathlib.Path, asset: pathlib.Path, fresh_project: Project
+):
+    path = tmp_path / "saved.flp"
+    path.write_bytes(b"")
+    path.chmod(0o640)
+    link = tmp_path / "link.flp"
+    link.symlink_to(path)
+
+    pyflp.save(fresh_project, link)
+    assert link.is_symlink()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert path.read_bytes() == asset.read_bytes()
+
+    hardlink = tmp_path / "hardlink.flp"
+    os.link(path, hardlink)
+    path.write_bytes(b"")
+    pyflp.save(fresh_project, path)
+    assert path.samefile(hardlink)
+    assert hardlink.read_bytes() == asset.read_bytes()
+
+    umask = os.umask(0o022)
+    try:
+        pyflp.save(fresh_project, tmp_path / "new.flp")
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE((tmp_path / "new.flp").stat().st_mode) == 0o644
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_save_read_only(tmp_path: pathlib.Path, fresh_project: Project):
+    path = tmp_path / "saved.flp"
+    path.write_bytes(b"")
+    path.chmod(0o444)
+    if os.access(path, os.W_OK):
+        pytest.skip("Running with privileges to write to any file")
+
+    with pytest.raises(PermissionError):
+        pyflp.save(fresh_project, path)
+    assert path.read_bytes() == b""
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid(), reason="Needs root")
+def test_save_owner(tmp_path: pathlib.Path, fresh_project: Project):
+    path = tmp_path / "saved.flp"
+    path.write_bytes(b"")
+    os.chown(path, 1234, 5678)
+
+    pyflp.save(fresh_project, path)
+    assert (path.stat().st_uid, path.stat().st_gid) == (1234, 5678)
+
+
+def test_dumps(asset: pathlib.Path, project: Project):
+    assert pyflp.dumps(project) == asset.read_bytes()
+
+    stream = io.BytesIO()
+    pyflp.save(project, stream)
+    assert stream.getvalue() == asset.read_bytes()
+
+
+def test_save_incremental(tmp_path: pathlib.Path, asset: pathlib.Path):
+    project = pyflp.parse(asset, lazy=True)
+    project.tempo = 133.5
+    project.channels[0].name = "Renamed"
+    segments = project._events_tuple.segments()
+    assert sum(not isinstance(s, memoryview) for s in segments) == 2
+
+    pyflp.save(project, tmp_path / "saved.flp")
+    saved = pyflp.parse(tmp_path / "saved.flp")
+    assert saved.tempo == 133.5
+    assert saved.channels[0].name == "Renamed"
+    assert pickle.loads(pickle.dumps(project)).tempo == 133.5
+
+
+def test_sizeof(asset: pathlib.Path):
+    project = pyflp.parse(asset, lazy=True)
+    assert project.sizeof() == asset.stat().st_size - 22
+
+    project.channels[0].name = "A much longer name than the one it had before"
+    project.comments = ""
+    assert project.sizeof() == len(pyflp.dumps(project)) - 22
+
+
+def test_parse_include(tmp_path: pathlib.Path, asset: pathlib.Path, project: Project):
+    partial = pyflp.parse(asset, include={"patterns"})
+    assert [tuple(n.key for n in p) for p in partial.patterns] == [
+        tuple(n.key for n in p) for p in project.patterns
+    ]
+    assert all(
+        type(e).__name__ == "UnknownDataEvent"
+        for e in partial.events_astuple()
+        if e.id == MixerID.Params
+    )
+
+    pyflp.save(partial, str(tmp_path / "saved.flp"))
+    assert (tmp_path / "saved.flp").read_bytes() == asset.read_bytes()
+
+    with pytest.raises(ValueError):
+        pyflp.parse(asset, include={"sequencer"})
+
+
+def test_pickle(project: Project):
+    unpickled = pickle.loads(pickle.dumps(project))
+    assert unpickled.events_astuple() == project.events_astuple()
+    assert [ch.name for ch in unpickled.channels] == [
+        ch.name for ch in project.channels
+    ]
+
+
+def test_parse_many(tmp_path: pathlib.Path, asset: pathlib.Path, project: Project):
+    missing = tmp_path / "missing.flp"
+    results = dict(pyflp.parse_many([asset, missing, asset], workers=2))
+    assert isinstance(results.pop(missing), FileNotFoundError)
+    assert results[asset].events_astuple() == project.events_astuple()
+
+
+def test_sections():
+    ids = [
+        ChannelID.New,
+        PluginID.Name,
+        TimeMarkerID.Position,  # Of a pattern
+        PatternID.New,
+        InsertID.Flags,
+        ChannelID.New,  # Found after inserts began
+        PluginID.Name,
+        ArrangementID.New,
+        TimeMarkerID.Position,
+    ]
+    assert _index_sections(ids) == ([0, 1], [4, 6], [3], [7, 8])
+
+
+def test_views(fresh_project: Project):
+    assert fresh_project.mixer is fresh_project.mixer
+    assert fresh_project.mixer[5] is fresh_project.mixer[5]
+    assert next(iter(fresh_project.patterns)) is next(iter(fresh_project.patterns))
+    assert fresh_project.arrangements[0] is fresh_project.arrangements[0]
+
+    channels = fresh_project.channels
+    fresh_project.channel_count += 1
+    assert fresh_project.channels is not channels
+
+    mixer = fresh_project.mixer
+    fresh_project.version = "20.8.3"
+    assert fresh_project.mixer is not mixer
+    assert fresh_project.mixer.events_astuple() == mixer.events_astuple()
+
+
+def test_slots(project: Project):
+    for event in project.events_astuple():
+        assert not hasattr(event, "__dict__"), type(event)
+    for model in (project, *project.channels, *project.mixer, *project.patterns):
+        assert not hasattr(model, "__dict__"), type(model)